@@ -3,7 +3,7 @@ Orchestrator Agent
 Master coordinator for the entire CV enhancement pipeline
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, AsyncIterator
 import logging
 import asyncio
 from datetime import datetime
@@ -110,7 +110,8 @@ class OrchestratorAgent(BaseAgent):
         cv_file: str,
         job_ad: str,
         user_id: Optional[str] = None,
-        job_source_type: str = "text"
+        job_source_type: str = "text",
+        on_step: Optional[Callable[[str, str], None]] = None
     ) -> Dict[str, Any]:
         """
         Main entry point: Process complete CV enhancement pipeline
@@ -122,6 +123,7 @@ class OrchestratorAgent(BaseAgent):
             job_ad: Job advertisement (text or URL)
             user_id: User identifier
             job_source_type: 'text' or 'url'
+            on_step: Called with (step, status) as each step finishes
 
         Returns:
             Complete pipeline result with generated DOCX and JSON files
@@ -146,6 +148,13 @@ class OrchestratorAgent(BaseAgent):
                 "steps_completed": []
             }
 
+            def step_done(step: str, status: str = "completed") -> None:
+                """Record a finished step and report it to on_step"""
+                if status == "completed":
+                    session_state["steps_completed"].append(step)
+                if on_step:
+                    on_step(step, status)
+
             # ==============================================================
             # STEP 1: CV Ingestion (A2A Call)
             # ==============================================================
@@ -164,8 +173,8 @@ class OrchestratorAgent(BaseAgent):
                 raise Exception(f"CV ingestion failed: {cv_ingestion_result['error']}")
 
             cv_data = cv_ingestion_result["data"]
-            session_state["steps_completed"].append("cv_ingestion")
             session_state["cv_data"] = cv_data
+            step_done("cv_ingestion")
 
             logger.info(f"[{self.name}] ✓ Step 1 Complete: CV parsed successfully")
 
@@ -188,8 +197,8 @@ class OrchestratorAgent(BaseAgent):
                 raise Exception(f"Gap analysis failed: {gap_analysis_result['error']}")
 
             gap_analysis = gap_analysis_result["data"]
-            session_state["steps_completed"].append("gap_analysis")
             session_state["gap_analysis"] = gap_analysis
+            step_done("gap_analysis")
 
             logger.info(f"[{self.name}] ✓ Step 2 Complete: Found {len(gap_analysis['gaps'])} gaps ({gap_analysis['overallMatch']:.1f}% match)")
 
@@ -211,13 +220,15 @@ class OrchestratorAgent(BaseAgent):
                 if interaction_result["success"]:
                     updated_cv_data = interaction_result["data"]["updated_cv_data"]
                     session_state["cv_data"]["cv_data"] = updated_cv_data
-                    session_state["steps_completed"].append("user_interaction")
+                    step_done("user_interaction")
 
                     logger.info(f"[{self.name}] ✓ Step 3 Complete: Collected additional information")
                 else:
                     logger.warning(f"[{self.name}] Step 3: User interaction had issues, continuing...")
+                    step_done("user_interaction", "failed")
             else:
                 logger.info(f"[{self.name}] Step 3: Skipped (no gaps to address)")
+                step_done("user_interaction", "skipped")
 
             # ==============================================================
             # STEP 4: Store Knowledge (A2A Call)
@@ -241,9 +252,12 @@ class OrchestratorAgent(BaseAgent):
             if storage_result["success"]:
                 profile_id = storage_result["data"]["profile_id"]
                 session_state["profile_id"] = profile_id
-                session_state["steps_completed"].append("knowledge_storage")
+                step_done("knowledge_storage")
 
                 logger.info(f"[{self.name}] ✓ Step 4 Complete: Stored CV profile: {profile_id}")
+            else:
+                logger.warning(f"[{self.name}] Step 4: Storing CV profile failed, continuing...")
+                step_done("knowledge_storage", "failed")
 
             # Store session
             session_storage_result = await self.call_agent(
@@ -275,8 +289,8 @@ class OrchestratorAgent(BaseAgent):
                 raise Exception(f"CV generation failed: {generation_result['error']}")
 
             generation_data = generation_result["data"]
-            session_state["steps_completed"].append("cv_generation")
             session_state["output_files"] = generation_data["output_files"]
+            step_done("cv_generation")
             session_state["status"] = "completed"
 
             logger.info(f"[{self.name}] ✓ Step 5 Complete: Generated CV files (DOCX + JSON)")
@@ -313,6 +327,36 @@ class OrchestratorAgent(BaseAgent):
                 "steps_completed": session_state.get("steps_completed", []) if 'session_state' in locals() else []
             }
 
+    async def stream_cv_request(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the pipeline, yielding progress as each step finishes
+
+        Args:
+            **kwargs: Arguments for process_cv_request
+
+        Yields:
+            {"step", "status"} for each step, then a final
+            {"step": "pipeline", "status", "result"} with the pipeline result
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self.process_cv_request(
+            **kwargs,
+            on_step=lambda step, status: events.put_nowait({"step": step, "status": status})
+        ))
+        # Sentinel after the last step event
+        task.add_done_callback(lambda _: events.put_nowait(None))
+
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+
+            result = task.result()
+            yield {"step": "pipeline", "status": result["status"], "result": result}
+        finally:
+            # Consumer stopped early
+            if not task.done():
+                task.cancel()
+
     async def process(self, **kwargs) -> Dict[str, Any]:
         """Main processing entry point"""
         return await self.process_cv_request(**kwargs)
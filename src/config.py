@@ -4,7 +4,8 @@ Creates storage and LLM providers based on environment configuration
 """
 
 import os
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Set, Callable
 from pathlib import Path
 import logging
 
@@ -13,6 +14,10 @@ from .llm import LLMProvider, OllamaProvider, OpenAIProvider, AnthropicProvider,
 
 logger = logging.getLogger(__name__)
 
+# Resolved paths of .env files already loaded into the process environment
+_loaded_env_files: Set[str] = set()
+_env_lock = threading.Lock()
+
 
 class Config:
     """Application configuration"""
@@ -27,51 +32,60 @@ class Config:
         if env_file:
             self._load_env_file(env_file)
 
-        self.mode = os.getenv("MODE", "local")
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        env = os.environ.get
+
+        self.mode = env("MODE", "local")
+        self.log_level = env("LOG_LEVEL", "INFO")
 
         # Storage configuration
-        self.storage_type = os.getenv("STORAGE_TYPE", "local")
-        self.data_dir = os.getenv("DATA_DIR", "./data")
-        self.gcs_bucket_uploads = os.getenv("GCS_BUCKET_UPLOADS")
-        self.gcs_bucket_outputs = os.getenv("GCS_BUCKET_OUTPUTS")
+        self.storage_type = env("STORAGE_TYPE", "local")
+        self.data_dir = env("DATA_DIR", "./data")
+        self.gcs_bucket_uploads = env("GCS_BUCKET_UPLOADS")
+        self.gcs_bucket_outputs = env("GCS_BUCKET_OUTPUTS")
 
         # LLM configuration
-        self.llm_provider = os.getenv("LLM_PROVIDER", "ollama")
-        self.llm_model = os.getenv("LLM_MODEL")
-        self.llm_api_key = os.getenv("LLM_API_KEY")
-        self.llm_api_base = os.getenv("LLM_API_BASE")
-        self.llm_temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
-        self.llm_max_tokens = int(os.getenv("LLM_MAX_TOKENS", "2048"))
+        self.llm_provider = env("LLM_PROVIDER", "ollama")
+        self.llm_model = env("LLM_MODEL")
+        self.llm_api_key = env("LLM_API_KEY")
+        self.llm_api_base = env("LLM_API_BASE")
+        self.llm_temperature = float(env("LLM_TEMPERATURE", "0.7"))
+        self.llm_max_tokens = int(env("LLM_MAX_TOKENS", "2048"))
 
         # GCP configuration
-        self.gcp_project_id = os.getenv("GCP_PROJECT_ID")
-        self.gcp_region = os.getenv("GCP_REGION", "us-central1")
+        self.gcp_project_id = env("GCP_PROJECT_ID")
+        self.gcp_region = env("GCP_REGION", "us-central1")
 
         # Vector DB configuration
-        self.vector_db_type = os.getenv("VECTOR_DB_TYPE", "faiss")
-        self.vector_db_path = os.getenv("VECTOR_DB_PATH", "./data/embeddings")
+        self.vector_db_type = env("VECTOR_DB_TYPE", "faiss")
+        self.vector_db_path = env("VECTOR_DB_PATH", "./data/embeddings")
 
         # Firestore configuration
-        self.firestore_database = os.getenv("FIRESTORE_DATABASE", "(default)")
+        self.firestore_database = env("FIRESTORE_DATABASE", "(default)")
 
         # ADK configuration
-        self.adk_mode = os.getenv("ADK_MODE", "local")
-        self.adk_host = os.getenv("ADK_HOST", "localhost")
-        self.adk_port = int(os.getenv("ADK_PORT", "8000"))
+        self.adk_mode = env("ADK_MODE", "local")
+        self.adk_host = env("ADK_HOST", "localhost")
+        self.adk_port = int(env("ADK_PORT", "8000"))
 
-        logger.info(f"Configuration loaded: mode={self.mode}, llm={self.llm_provider}, storage={self.storage_type}")
+        logger.info("Configuration loaded: mode=%s, llm=%s, storage=%s", self.mode, self.llm_provider, self.storage_type)
 
     def _load_env_file(self, env_file: str) -> None:
-        """Load environment variables from file"""
-        try:
-            from dotenv import load_dotenv
-            load_dotenv(env_file)
-            logger.info(f"Loaded environment from: {env_file}")
-        except ImportError:
-            logger.warning("python-dotenv not installed, skipping .env file")
-        except Exception as e:
-            logger.error(f"Failed to load env file: {e}")
+        """Load environment variables from file (once per process)"""
+        env_path = str(Path(env_file).resolve())
+
+        with _env_lock:
+            if env_path in _loaded_env_files:
+                return
+
+            try:
+                from dotenv import load_dotenv
+                load_dotenv(env_path)
+                _loaded_env_files.add(env_path)
+                logger.info("Loaded environment from: %s", env_file)
+            except ImportError:
+                logger.warning("python-dotenv not installed, skipping .env file")
+            except Exception as e:
+                logger.error("Failed to load env file: %s", e)
 
     def is_local(self) -> bool:
         """Check if running in local mode"""
@@ -112,14 +126,14 @@ def get_storage_backend(config: Optional[Config] = None) -> StorageBackend:
         config = Config()
 
     if config.storage_type == "local":
-        logger.info(f"Creating local storage backend: {config.data_dir}")
+        logger.info("Creating local storage backend: %s", config.data_dir)
         return LocalStorage(base_dir=config.data_dir)
 
     elif config.storage_type == "gcs":
         if not config.gcs_bucket_uploads:
             raise ValueError("GCS_BUCKET_UPLOADS environment variable required for GCS storage")
 
-        logger.info(f"Creating GCS storage backend: {config.gcs_bucket_uploads}")
+        logger.info("Creating GCS storage backend: %s", config.gcs_bucket_uploads)
         return GCSStorage(
             bucket_name=config.gcs_bucket_uploads,
             project_id=config.gcp_project_id
@@ -129,6 +143,75 @@ def get_storage_backend(config: Optional[Config] = None) -> StorageBackend:
         raise ValueError(f"Unknown storage type: {config.storage_type}")
 
 
+def _build_ollama(config: Config) -> LLMProvider:
+    """Create Ollama provider from configuration"""
+    model = config.llm_model or "llama3:8b"
+    api_base = config.llm_api_base or "http://localhost:11434"
+
+    logger.info("Creating Ollama provider: %s @ %s", model, api_base)
+    return OllamaProvider(
+        model=model,
+        api_base=api_base,
+        temperature=config.llm_temperature,
+        max_tokens=config.llm_max_tokens,
+    )
+
+
+def _build_openai(config: Config) -> LLMProvider:
+    """Create OpenAI provider from configuration"""
+    if not config.llm_api_key:
+        raise ValueError("LLM_API_KEY environment variable required for OpenAI")
+
+    model = config.llm_model or "gpt-4o-mini"
+
+    logger.info("Creating OpenAI provider: %s", model)
+    return OpenAIProvider(
+        model=model,
+        api_key=config.llm_api_key,
+        temperature=config.llm_temperature,
+        max_tokens=config.llm_max_tokens,
+    )
+
+
+def _build_anthropic(config: Config) -> LLMProvider:
+    """Create Anthropic provider from configuration"""
+    if not config.llm_api_key:
+        raise ValueError("LLM_API_KEY environment variable required for Anthropic")
+
+    model = config.llm_model or "claude-3-5-haiku-20241022"
+
+    logger.info("Creating Anthropic provider: %s", model)
+    return AnthropicProvider(
+        model=model,
+        api_key=config.llm_api_key,
+        temperature=config.llm_temperature,
+        max_tokens=config.llm_max_tokens,
+    )
+
+
+def _build_gemini(config: Config) -> LLMProvider:
+    """Create Gemini provider from configuration"""
+    model = config.llm_model or "gemini-1.5-flash"
+
+    logger.info("Creating Gemini provider: %s", model)
+    return GeminiProvider(
+        model=model,
+        project_id=config.gcp_project_id,
+        location=config.gcp_region,
+        temperature=config.llm_temperature,
+        max_tokens=config.llm_max_tokens,
+    )
+
+
+# LLM provider name -> factory
+_LLM_BUILDERS: Dict[str, Callable[[Config], LLMProvider]] = {
+    "ollama": _build_ollama,
+    "openai": _build_openai,
+    "anthropic": _build_anthropic,
+    "gemini": _build_gemini,
+}
+
+
 def get_llm_provider(config: Optional[Config] = None) -> LLMProvider:
     """
     Create LLM provider based on configuration
@@ -144,60 +227,12 @@ def get_llm_provider(config: Optional[Config] = None) -> LLMProvider:
 
     provider = config.llm_provider.lower()
 
-    if provider == "ollama":
-        model = config.llm_model or "llama3:8b"
-        api_base = config.llm_api_base or "http://localhost:11434"
-
-        logger.info(f"Creating Ollama provider: {model} @ {api_base}")
-        return OllamaProvider(
-            model=model,
-            api_base=api_base,
-            temperature=config.llm_temperature,
-            max_tokens=config.llm_max_tokens,
-        )
-
-    elif provider == "openai":
-        if not config.llm_api_key:
-            raise ValueError("LLM_API_KEY environment variable required for OpenAI")
-
-        model = config.llm_model or "gpt-4o-mini"
-
-        logger.info(f"Creating OpenAI provider: {model}")
-        return OpenAIProvider(
-            model=model,
-            api_key=config.llm_api_key,
-            temperature=config.llm_temperature,
-            max_tokens=config.llm_max_tokens,
-        )
-
-    elif provider == "anthropic":
-        if not config.llm_api_key:
-            raise ValueError("LLM_API_KEY environment variable required for Anthropic")
-
-        model = config.llm_model or "claude-3-5-haiku-20241022"
-
-        logger.info(f"Creating Anthropic provider: {model}")
-        return AnthropicProvider(
-            model=model,
-            api_key=config.llm_api_key,
-            temperature=config.llm_temperature,
-            max_tokens=config.llm_max_tokens,
-        )
+    try:
+        builder = _LLM_BUILDERS[provider]
+    except KeyError:
+        raise ValueError(f"Unknown LLM provider: {provider}") from None
 
-    elif provider == "gemini":
-        model = config.llm_model or "gemini-1.5-flash"
-
-        logger.info(f"Creating Gemini provider: {model}")
-        return GeminiProvider(
-            model=model,
-            project_id=config.gcp_project_id,
-            location=config.gcp_region,
-            temperature=config.llm_temperature,
-            max_tokens=config.llm_max_tokens,
-        )
-
-    else:
-        raise ValueError(f"Unknown LLM provider: {provider}")
+    return builder(config)
 
 
 def setup_logging(config: Optional[Config] = None) -> None:
@@ -218,7 +253,7 @@ def setup_logging(config: Optional[Config] = None) -> None:
         ]
     )
 
-    logger.info(f"Logging configured: level={config.log_level}")
+    logger.info("Logging configured: level=%s", config.log_level)
 
 
 # Global configuration instance
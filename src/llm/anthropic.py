@@ -4,6 +4,8 @@ For development with Claude models
 """
 
 from typing import Optional, List
+from collections import OrderedDict
+import asyncio
 import logging
 
 from anthropic import AsyncAnthropic
@@ -12,6 +14,9 @@ from .base import LLMProvider, LLMMessage, LLMResponse
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct texts kept in the token count cache
+TOKEN_CACHE_SIZE = 4096
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude LLM provider"""
@@ -39,7 +44,12 @@ class AnthropicProvider(LLMProvider):
             raise ValueError("Anthropic API key is required")
 
         self.client = AsyncAnthropic(api_key=api_key)
-        logger.info(f"Initialized Anthropic provider: {model}")
+
+        # Token counts per text (pending or resolved), so identical texts
+        # only hit the count-tokens endpoint once
+        self._token_cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+
+        logger.info("Initialized Anthropic provider: %s", model)
 
     async def complete(
         self,
@@ -68,6 +78,23 @@ class AnthropicProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate chat response using Claude"""
+        cache_key = self._response_cache_key(
+            messages, temperature, max_tokens, system=system, **kwargs
+        )
+        return await self._dedup_chat(
+            cache_key,
+            lambda: self._chat(messages, temperature, max_tokens, system, **kwargs)
+        )
+
+    async def _chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        system: Optional[str],
+        **kwargs
+    ) -> LLMResponse:
+        """Send a chat request to Claude"""
         try:
             # Convert messages to Anthropic format
             # Anthropic requires alternating user/assistant messages
@@ -79,10 +106,7 @@ class AnthropicProvider(LLMProvider):
                     # Anthropic uses separate system parameter
                     system_message = msg.content
                 else:
-                    anthropic_messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
+                    anthropic_messages.append(msg.to_dict())
 
             # Use provided system or extracted system message
             final_system = system or system_message
@@ -101,27 +125,28 @@ class AnthropicProvider(LLMProvider):
             response = await self.client.messages.create(**request_params)
 
             # Extract text content from response
-            content = ""
-            if response.content:
-                for block in response.content:
-                    if hasattr(block, "text"):
-                        content += block.text
+            content = "".join(
+                block.text
+                for block in (response.content or ())
+                if getattr(block, "text", None)
+            )
+            usage = response.usage
 
             return LLMResponse(
                 content=content,
                 model=response.model,
-                tokens_used=response.usage.input_tokens + response.usage.output_tokens if response.usage else None,
+                tokens_used=usage.input_tokens + usage.output_tokens if usage else None,
                 finish_reason=response.stop_reason,
                 metadata={
-                    "input_tokens": response.usage.input_tokens if response.usage else None,
-                    "output_tokens": response.usage.output_tokens if response.usage else None,
+                    "input_tokens": usage.input_tokens if usage else None,
+                    "output_tokens": usage.output_tokens if usage else None,
                     "id": response.id,
                     "stop_sequence": response.stop_sequence,
                 }
             )
 
         except Exception as e:
-            logger.error(f"Anthropic completion failed: {e}")
+            logger.error("Anthropic completion failed: %s", e)
             raise
 
     def get_token_count(self, text: str) -> int:
@@ -137,18 +162,51 @@ class AnthropicProvider(LLMProvider):
         """
         Get accurate token count from Anthropic API
 
+        Results are cached per text; concurrent calls for the same text
+        share a single API request, and issue it again if it is cancelled.
+
         Args:
             text: Text to count tokens for
 
         Returns:
             Exact token count
         """
+        while True:
+            future = self._token_cache.get(text)
+            if future is None:
+                break
+
+            self._token_cache.move_to_end(text)
+            count = await asyncio.shield(future)
+            if count is not None:
+                return count
+            # The request in flight was cancelled, issue it again
+
+        future = asyncio.get_running_loop().create_future()
+        self._token_cache[text] = future
+        if len(self._token_cache) > TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+
         try:
-            response = await self.client.messages.count_tokens(
-                model=self.model,
-                messages=[{"role": "user", "content": text}]
-            )
-            return response.input_tokens
+            count = await self._count_tokens_remote(text)
+        except asyncio.CancelledError:
+            self._token_cache.pop(text, None)
+            # Wake up waiters so they retry instead of being cancelled too
+            future.set_result(None)
+            raise
         except Exception as e:
-            logger.warning(f"Token counting failed, using estimate: {e}")
-            return self.get_token_count(text)
+            logger.warning("Token counting failed, using estimate: %s", e)
+            # Don't cache failures, the next call retries the API
+            self._token_cache.pop(text, None)
+            count = self.get_token_count(text)
+
+        future.set_result(count)
+        return count
+
+    async def _count_tokens_remote(self, text: str) -> int:
+        """Count tokens for text via the Anthropic count-tokens endpoint"""
+        response = await self.client.messages.count_tokens(
+            model=self.model,
+            messages=[{"role": "user", "content": text}]
+        )
+        return response.input_tokens
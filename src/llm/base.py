@@ -4,21 +4,39 @@ Defines the contract for all LLM implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import asyncio
+import hashlib
+import json
 import logging
+import re
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of deterministic responses kept per provider
+RESPONSE_CACHE_SIZE = 512
+
+# Markdown code fences around a JSON response, each of which may be missing
+_JSON_FENCE_OPEN = re.compile(r"^\s*```(?:json)?")
+_JSON_FENCE_CLOSE = re.compile(r"```\s*$")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMMessage:
     """Represents a message in the conversation"""
     role: str  # 'system', 'user', 'assistant'
     content: str
 
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to the role/content dict used by provider APIs"""
+        return {"role": self.role, "content": self.content}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
     """Represents a response from the LLM"""
     content: str
@@ -28,6 +46,13 @@ class LLMResponse:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def _copy_response(response: LLMResponse) -> LLMResponse:
+    """Copy a response so callers never share its mutable metadata"""
+    if response.metadata is None:
+        return response
+    return replace(response, metadata=dict(response.metadata))
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
 
@@ -52,6 +77,12 @@ class LLMProvider(ABC):
         self.max_tokens = max_tokens
         self.kwargs = kwargs
 
+        # Responses to deterministic (temperature 0) requests, keyed by request hash
+        self._response_cache: "OrderedDict[bytes, LLMResponse]" = OrderedDict()
+
+        # Deterministic requests currently awaiting a response, keyed like the cache
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+
     @abstractmethod
     async def complete(
         self,
@@ -124,6 +155,119 @@ class LLMProvider(ABC):
             "max_tokens": self.max_tokens
         }
 
+    def _response_cache_key(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Optional[bytes]:
+        """
+        Build the response cache key for a chat request
+
+        Only deterministic requests (effective temperature 0) are cacheable.
+
+        Args:
+            messages: List of conversation messages
+            temperature: Requested temperature override
+            max_tokens: Requested max tokens override
+            **kwargs: Additional request arguments that affect the response
+
+        Returns:
+            Cache key, or None if the request should not be cached
+        """
+        if (temperature or self.temperature) != 0.0:
+            return None
+
+        payload = json.dumps(
+            [
+                self.get_provider_name(),
+                self.model,
+                max_tokens or self.max_tokens,
+                [(m.role, m.content) for m in messages],
+                kwargs,
+            ],
+            separators=(",", ":"),
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    def _get_cached_response(self, key: Optional[bytes]) -> Optional[LLMResponse]:
+        """Get a cached response for a request key, if any"""
+        if key is None:
+            return None
+
+        response = self._response_cache.get(key)
+        if response is not None:
+            self._response_cache.move_to_end(key)
+            logger.debug("Response cache hit for %s:%s", self.get_provider_name(), self.model)
+            return _copy_response(response)
+        return None
+
+    def _cache_response(self, key: Optional[bytes], response: LLMResponse) -> LLMResponse:
+        """Store a copy of a response under a request key and return the response"""
+        if key is not None:
+            self._response_cache[key] = _copy_response(response)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
+    async def _dedup_chat(
+        self,
+        key: Optional[bytes],
+        coro_factory: Callable[[], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        """
+        Run a chat request, sharing results between identical deterministic requests
+
+        Cached responses are returned directly, and concurrent requests with
+        the same key wait for the one request already in flight. If that
+        request is cancelled, the waiters issue it again.
+
+        Args:
+            key: Response cache key (None disables caching and deduplication)
+            coro_factory: Callable returning the coroutine that sends the request
+
+        Returns:
+            LLMResponse object
+        """
+        if key is None:
+            return await coro_factory()
+
+        while True:
+            cached = self._get_cached_response(key)
+            if cached is not None:
+                return cached
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+
+            response = await asyncio.shield(pending)
+            if response is not None:
+                return _copy_response(response)
+            # The request in flight was cancelled, issue it again
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await coro_factory()
+        except asyncio.CancelledError:
+            # Wake up waiters so they retry instead of being cancelled too
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(self._cache_response(key, response))
+        return response
+
     async def complete_json(
         self,
         prompt: str,
@@ -141,8 +285,6 @@ class LLMProvider(ABC):
         Returns:
             Parsed JSON dictionary
         """
-        import json
-
         # Add JSON instruction to prompt
         json_prompt = f"{prompt}\n\nProvide your response as valid JSON."
 
@@ -153,20 +295,13 @@ class LLMProvider(ABC):
         )
 
         try:
-            # Try to extract JSON from response
-            content = response.content.strip()
-
-            # Handle markdown code blocks
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
+            # Try to extract JSON from response, handling markdown code blocks
+            content = _JSON_FENCE_OPEN.sub("", response.content, count=1)
+            content = _JSON_FENCE_CLOSE.sub("", content, count=1)
 
-            return json.loads(content.strip())
+            return orjson.loads(content.strip())
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response content: {response.content}")
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.error("Response content: %s", response.content)
             raise ValueError(f"LLM did not return valid JSON: {e}")
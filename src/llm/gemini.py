@@ -3,7 +3,7 @@ Google Gemini LLM Provider
 For Kaggle deployment with free Gemini Flash
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 import logging
 
 from google.cloud import aiplatform
@@ -49,7 +49,7 @@ class GeminiProvider(LLMProvider):
             vertexai.init(location=location)
 
         self.model_instance = GenerativeModel(model)
-        logger.info(f"Initialized Gemini provider: {model} in {location}")
+        logger.info("Initialized Gemini provider: %s in %s", model, location)
 
     async def complete(
         self,
@@ -77,71 +77,49 @@ class GeminiProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate chat response using Gemini"""
-        try:
-            # Convert messages to Gemini format
-            gemini_contents = []
-            system_instruction = None
-
-            for msg in messages:
-                if msg.role == "system":
-                    # Gemini uses system_instruction parameter
-                    system_instruction = msg.content
-                else:
-                    # Map roles: 'user' or 'model' (assistant)
-                    role = "user" if msg.role == "user" else "model"
-                    gemini_contents.append(
-                        Content(role=role, parts=[Part.from_text(msg.content)])
-                    )
+        cache_key = self._response_cache_key(messages, temperature, max_tokens, **kwargs)
+        return await self._dedup_chat(
+            cache_key,
+            lambda: self._chat(messages, temperature, max_tokens, **kwargs)
+        )
 
+    async def _chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> LLMResponse:
+        """Send a chat request to Gemini"""
+        try:
             # Configure generation parameters
             generation_config = {
                 "temperature": temperature or self.temperature,
                 "max_output_tokens": max_tokens or self.max_tokens,
             }
 
-            # Create chat session or generate
-            if len(gemini_contents) == 1:
-                # Single turn generation
-                if system_instruction:
-                    model = GenerativeModel(
-                        self.model,
-                        system_instruction=[system_instruction]
-                    )
-                else:
-                    model = self.model_instance
-
-                response = await model.generate_content_async(
-                    gemini_contents[0].parts,
+            if len(messages) == 1 and messages[0].role == "user":
+                # Single user turn without system instruction: send the text as is
+                response = await self.model_instance.generate_content_async(
+                    messages[0].content,
                     generation_config=generation_config,
                     **kwargs
                 )
             else:
-                # Multi-turn chat
-                if system_instruction:
-                    model = GenerativeModel(
-                        self.model,
-                        system_instruction=[system_instruction]
-                    )
-                else:
-                    model = self.model_instance
-
-                chat = model.start_chat(history=gemini_contents[:-1])
-                response = await chat.send_message_async(
-                    gemini_contents[-1].parts,
-                    generation_config=generation_config,
+                response = await self._generate_from_messages(
+                    messages,
+                    generation_config,
                     **kwargs
                 )
 
             # Extract text from response
-            content = response.text if hasattr(response, "text") else ""
+            content = getattr(response, "text", "")
 
             # Extract token usage if available
+            usage = getattr(response, "usage_metadata", None)
             tokens_used = None
-            if hasattr(response, "usage_metadata"):
-                tokens_used = (
-                    response.usage_metadata.prompt_token_count +
-                    response.usage_metadata.candidates_token_count
-                )
+            if usage:
+                tokens_used = usage.prompt_token_count + usage.candidates_token_count
 
             return LLMResponse(
                 content=content,
@@ -149,15 +127,82 @@ class GeminiProvider(LLMProvider):
                 tokens_used=tokens_used,
                 finish_reason="stop",
                 metadata={
-                    "prompt_tokens": response.usage_metadata.prompt_token_count if hasattr(response, "usage_metadata") else None,
-                    "completion_tokens": response.usage_metadata.candidates_token_count if hasattr(response, "usage_metadata") else None,
+                    "prompt_tokens": usage.prompt_token_count if usage else None,
+                    "completion_tokens": usage.candidates_token_count if usage else None,
                 }
             )
 
         except Exception as e:
-            logger.error(f"Gemini completion failed: {e}")
+            logger.error("Gemini completion failed: %s", e)
             raise
 
+    async def _generate_from_messages(
+        self,
+        messages: List[LLMMessage],
+        generation_config: Dict[str, Any],
+        **kwargs
+    ):
+        """
+        Generate a response for a conversation using Content/Part wrapping
+
+        Args:
+            messages: List of conversation messages
+            generation_config: Gemini generation parameters
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            Gemini response object
+        """
+        # Convert messages to Gemini format
+        gemini_contents = []
+        system_instruction = None
+
+        for msg in messages:
+            if msg.role == "system":
+                # Gemini uses system_instruction parameter
+                system_instruction = msg.content
+            else:
+                # Map roles: 'user' or 'model' (assistant)
+                role = "user" if msg.role == "user" else "model"
+                gemini_contents.append(
+                    Content(role=role, parts=[Part.from_text(msg.content)])
+                )
+
+        # Create chat session or generate
+        if len(gemini_contents) == 1:
+            # Single turn generation
+            if system_instruction:
+                model = GenerativeModel(
+                    self.model,
+                    system_instruction=[system_instruction]
+                )
+            else:
+                model = self.model_instance
+
+            response = await model.generate_content_async(
+                gemini_contents[0].parts,
+                generation_config=generation_config,
+                **kwargs
+            )
+        else:
+            # Multi-turn chat
+            if system_instruction:
+                model = GenerativeModel(
+                    self.model,
+                    system_instruction=[system_instruction]
+                )
+            else:
+                model = self.model_instance
+
+            chat = model.start_chat(history=gemini_contents[:-1])
+            response = await chat.send_message_async(
+                gemini_contents[-1].parts,
+                generation_config=generation_config,
+                **kwargs
+            )
+
+        return response
+
     def get_token_count(self, text: str) -> int:
         """
         Estimate token count for Gemini
@@ -169,6 +214,6 @@ class GeminiProvider(LLMProvider):
             token_count = model.count_tokens(text)
             return token_count.total_tokens
         except Exception as e:
-            logger.warning(f"Token counting failed, using estimate: {e}")
+            logger.warning("Token counting failed, using estimate: %s", e)
             # Fallback to rough estimate
             return len(text) // 4
@@ -3,10 +3,12 @@ Ollama LLM Provider
 For local development with free Ollama models
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 import aiohttp
 import logging
 
+import orjson
+
 from .base import LLMProvider, LLMMessage, LLMResponse
 
 logger = logging.getLogger(__name__)
@@ -34,7 +36,7 @@ class OllamaProvider(LLMProvider):
         """
         super().__init__(model, temperature, max_tokens, **kwargs)
         self.api_base = api_base.rstrip("/")
-        logger.info(f"Initialized Ollama provider: {model} @ {api_base}")
+        logger.info("Initialized Ollama provider: %s @ %s", model, api_base)
 
     async def complete(
         self,
@@ -62,35 +64,30 @@ class OllamaProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate chat response using Ollama"""
-        try:
-            url = f"{self.api_base}/api/chat"
-
-            # Convert messages to Ollama format
-            ollama_messages = [
-                {"role": msg.role, "content": msg.content}
-                for msg in messages
-            ]
-
-            payload = {
-                "model": self.model,
-                "messages": ollama_messages,
-                "stream": False,
-                "options": {
-                    "temperature": temperature or self.temperature,
-                    "num_predict": max_tokens or self.max_tokens,
-                }
-            }
+        cache_key = self._response_cache_key(messages, temperature, max_tokens, **kwargs)
+        return await self._dedup_chat(
+            cache_key,
+            lambda: self._chat(messages, temperature, max_tokens, **kwargs)
+        )
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Ollama API error: {error_text}")
+    async def _chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> LLMResponse:
+        """Send a chat request to Ollama"""
+        try:
+            chunks = []
+            data: Dict[str, Any] = {}
 
-                    data = await response.json()
+            async for data in self._stream_chat_objects(messages, temperature, max_tokens):
+                chunks.append(data.get("message", {}).get("content", ""))
 
-            content = data.get("message", {}).get("content", "")
+            content = "".join(chunks)
 
+            # The final ("done") object carries the timing and eval statistics
             return LLMResponse(
                 content=content,
                 model=self.model,
@@ -105,9 +102,82 @@ class OllamaProvider(LLMProvider):
             )
 
         except Exception as e:
-            logger.error(f"Ollama completion failed: {e}")
+            logger.error("Ollama completion failed: %s", e)
             raise
 
+    async def stream_chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response as it is generated
+
+        Args:
+            messages: List of conversation messages
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Yields:
+            Content chunks in generation order
+        """
+        try:
+            async for data in self._stream_chat_objects(messages, temperature, max_tokens):
+                chunk = data.get("message", {}).get("content", "")
+                if chunk:
+                    yield chunk
+
+        except Exception as e:
+            logger.error("Ollama streaming failed: %s", e)
+            raise
+
+    async def _stream_chat_objects(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Post a streaming chat request and yield each NDJSON object"""
+        url = f"{self.api_base}/api/chat"
+
+        # Convert messages to Ollama format
+        ollama_messages = list(map(LLMMessage.to_dict, messages))
+
+        payload = {
+            "model": self.model,
+            "messages": ollama_messages,
+            "stream": True,
+            "options": {
+                "temperature": temperature or self.temperature,
+                "num_predict": max_tokens or self.max_tokens,
+            }
+        }
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Ollama API error: {error_text}")
+
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+
+                    data = orjson.loads(line)
+                    if "error" in data:
+                        raise Exception(f"Ollama API error: {data['error']}")
+
+                    yield data
+
+                    if data.get("done"):
+                        break
+
     def get_token_count(self, text: str) -> int:
         """
         Estimate token count (rough approximation)
@@ -135,7 +205,7 @@ class OllamaProvider(LLMProvider):
                     return data.get("models", [])
 
         except Exception as e:
-            logger.error(f"List models failed: {e}")
+            logger.error("List models failed: %s", e)
             return []
 
     async def pull_model(self, model_name: str) -> bool:
@@ -159,9 +229,9 @@ class OllamaProvider(LLMProvider):
                     if response.status != 200:
                         return False
 
-                    logger.info(f"Successfully pulled model: {model_name}")
+                    logger.info("Successfully pulled model: %s", model_name)
                     return True
 
         except Exception as e:
-            logger.error(f"Pull model failed: {e}")
+            logger.error("Pull model failed: %s", e)
             return False
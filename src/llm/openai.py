@@ -3,16 +3,122 @@ OpenAI LLM Provider
 For development with OpenAI models
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict
+from functools import lru_cache
+import asyncio
 import logging
+import os
+import random
 
 from openai import AsyncOpenAI
+import httpx
+import openai
 import tiktoken
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from .base import LLMProvider, LLMMessage, LLMResponse
 
 logger = logging.getLogger(__name__)
 
+# Errors worth retrying: rate limits, dropped connections and 5xx
+# (APITimeoutError subclasses APIConnectionError; see _is_retryable)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+# Timeouts raised before the request reached the server, so safe to resend
+_UNSENT_TIMEOUTS = (httpx.ConnectTimeout, httpx.PoolTimeout)
+MAX_ATTEMPTS = 6
+MAX_RETRY_WAIT = 60.0
+
+# Above this many characters per budget token a text is treated as over
+# budget without encoding (cl100k averages ~4 characters per token)
+MAX_CHARS_PER_TOKEN = 8
+
+_backoff = wait_random_exponential(multiplier=1, max=MAX_RETRY_WAIT)
+
+
+def _retry_wait(retry_state) -> float:
+    """Wait for the server's Retry-After (plus jitter) if sent, else back off exponentially"""
+    error = retry_state.outcome.exception()
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            retry_after = float(response.headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+        else:
+            return min(retry_after + random.uniform(0, 1), MAX_RETRY_WAIT)
+    return _backoff(retry_state)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry transient failures, but not timeouts on a request already sent"""
+    if isinstance(error, openai.APITimeoutError):
+        # A read timeout means a slow completion; resending just repeats it
+        return isinstance(error.__cause__, _UNSENT_TIMEOUTS)
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+@lru_cache(maxsize=32)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Get the tiktoken encoding for a model (loaded once per model)"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to cl100k_base for newer models
+        return tiktoken.get_encoding("cl100k_base")
+
+
+# Shared clients per event loop and API key, so providers on a loop reuse
+# one connection pool; pooled connections can't be used from another loop
+_CLIENTS: Dict[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]] = {}
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for an API key on the running loop"""
+    loop = asyncio.get_running_loop()
+    clients = _CLIENTS.get(loop)
+    if clients is None:
+        # Drop clients of loops that have finished (e.g. earlier asyncio.run calls)
+        for closed in [other for other in _CLIENTS if other.is_closed()]:
+            del _CLIENTS[closed]
+        clients = _CLIENTS[loop] = {}
+
+    client = clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            # Retries are handled by OpenAIProvider._create_completion
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                # The SDK's own default; a custom http_client replaces it
+                timeout=openai.DEFAULT_TIMEOUT,
+            ),
+        )
+        clients[api_key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """
+    Close the shared OpenAI clients of the running event loop
+
+    Call on application shutdown to release pooled connections.
+    """
+    clients = _CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI LLM provider"""
@@ -23,6 +129,7 @@ class OpenAIProvider(LLMProvider):
         api_key: str = None,
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        request_timeout: Optional[float] = None,
         **kwargs
     ):
         """
@@ -33,22 +140,25 @@ class OpenAIProvider(LLMProvider):
             api_key: OpenAI API key
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            request_timeout: Seconds to wait for a completion (SDK default if None)
         """
         super().__init__(model, temperature, max_tokens, **kwargs)
 
         if not api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.request_timeout = request_timeout
+        self._api_key = api_key
 
         # Initialize tokenizer for token counting
-        try:
-            self.encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            # Fallback to cl100k_base for newer models
-            self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.encoding = _get_encoding(model)
+
+        logger.info("Initialized OpenAI provider: %s", model)
 
-        logger.info(f"Initialized OpenAI provider: {model}")
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Shared OpenAI client for this provider's API key on the running loop"""
+        return _get_client(self._api_key)
 
     async def complete(
         self,
@@ -56,18 +166,81 @@ class OpenAIProvider(LLMProvider):
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        static_prefix: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
-        """Generate completion using OpenAI"""
+        """
+        Generate completion using OpenAI
+
+        Messages are ordered from most to least stable (system prompt,
+        static_prefix, prompt) so repeated calls share the longest possible
+        prefix for OpenAI's automatic prompt caching. Keep system_prompt and
+        static_prefix identical across calls to benefit; the number of cached
+        prompt tokens is reported in metadata["cached_tokens"].
+
+        Args:
+            prompt: User prompt (the part that varies between calls)
+            system_prompt: Optional system prompt
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            static_prefix: Optional instructions sent before the prompt
+            **kwargs: Additional OpenAI arguments
+
+        Returns:
+            LLMResponse object
+        """
         messages = []
 
         if system_prompt:
             messages.append(LLMMessage(role="system", content=system_prompt))
 
+        if static_prefix:
+            messages.append(LLMMessage(role="user", content=static_prefix))
+
         messages.append(LLMMessage(role="user", content=prompt))
 
         return await self.chat(messages, temperature, max_tokens, **kwargs)
 
+    async def chat_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        concurrency: int = 20,
+        **kwargs
+    ) -> List[LLMResponse]:
+        """
+        Generate completions for many prompts sharing one system prompt
+
+        Requests run concurrently, at most `concurrency` at a time, and
+        every request starts with the same system message.
+
+        Args:
+            prompts: User prompts
+            system_prompt: Optional system prompt shared by all prompts
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            concurrency: Maximum number of requests in flight
+            **kwargs: Additional arguments passed to each request
+
+        Returns:
+            LLMResponse per prompt, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def complete_one(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(
+                    prompt,
+                    system_prompt,
+                    temperature,
+                    max_tokens,
+                    **kwargs
+                )
+
+        return list(await asyncio.gather(*(complete_one(p) for p in prompts)))
+
     async def chat(
         self,
         messages: List[LLMMessage],
@@ -76,14 +249,25 @@ class OpenAIProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate chat response using OpenAI"""
+        cache_key = self._response_cache_key(messages, temperature, max_tokens, **kwargs)
+        return await self._dedup_chat(
+            cache_key,
+            lambda: self._chat(messages, temperature, max_tokens, **kwargs)
+        )
+
+    async def _chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> LLMResponse:
+        """Send a chat request to OpenAI"""
         try:
             # Convert messages to OpenAI format
-            openai_messages = [
-                {"role": msg.role, "content": msg.content}
-                for msg in messages
-            ]
+            openai_messages = list(map(LLMMessage.to_dict, messages))
 
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=openai_messages,
                 temperature=temperature or self.temperature,
@@ -93,28 +277,86 @@ class OpenAIProvider(LLMProvider):
 
             choice = response.choices[0]
             content = choice.message.content or ""
+            usage = response.usage
+            prompt_details = getattr(usage, "prompt_tokens_details", None)
 
             return LLMResponse(
                 content=content,
                 model=response.model,
-                tokens_used=response.usage.total_tokens if response.usage else None,
+                tokens_used=usage.total_tokens if usage else None,
                 finish_reason=choice.finish_reason,
                 metadata={
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else None,
+                    "prompt_tokens": usage.prompt_tokens if usage else None,
+                    "completion_tokens": usage.completion_tokens if usage else None,
+                    "cached_tokens": getattr(prompt_details, "cached_tokens", None),
                     "id": response.id,
                 }
             )
 
         except Exception as e:
-            logger.error(f"OpenAI completion failed: {e}")
+            logger.error("OpenAI completion failed: %s", e)
             raise
 
+    @retry(
+        wait=_retry_wait,
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _create_completion(self, **params):
+        """Create a chat completion, retrying transient failures"""
+        if self.request_timeout is not None:
+            params.setdefault("timeout", self.request_timeout)
+        return await self.client.chat.completions.create(**params)
+
     def get_token_count(self, text: str) -> int:
         """Get accurate token count using tiktoken"""
         try:
-            return len(self.encoding.encode(text))
+            return len(self.encoding.encode_ordinary(text))
         except Exception as e:
-            logger.warning(f"Token counting failed, using estimate: {e}")
+            logger.warning("Token counting failed, using estimate: %s", e)
             # Fallback to rough estimate
             return len(text) // 4
+
+    def fits_in_budget(self, text: str, budget: int) -> bool:
+        """
+        Check whether text encodes to at most `budget` tokens
+
+        Cheaper than get_token_count for yes/no checks: every token covers
+        at least one UTF-8 byte, so short texts fit without encoding, and
+        texts longer than MAX_CHARS_PER_TOKEN characters per budget token
+        are rejected without encoding. Only texts in between are encoded.
+
+        Args:
+            text: Text to check
+            budget: Maximum number of tokens
+
+        Returns:
+            True if the text fits in the budget
+        """
+        if len(text) > budget * MAX_CHARS_PER_TOKEN:
+            return False
+        if len(text.encode("utf-8")) <= budget:
+            return True
+        return self.get_token_count(text) <= budget
+
+    def get_token_counts(self, texts: List[str]) -> List[int]:
+        """
+        Get accurate token counts for several texts in one batch
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Token count per text, in input order
+        """
+        try:
+            encoded = self.encoding.encode_ordinary_batch(
+                texts,
+                num_threads=os.cpu_count() or 1
+            )
+            return [len(tokens) for tokens in encoded]
+        except Exception as e:
+            logger.warning("Batch token counting failed, using estimate: %s", e)
+            return [len(text) // 4 for text in texts]
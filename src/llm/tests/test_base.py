@@ -0,0 +1,136 @@
+"""
+Unit tests for the shared LLM provider logic
+"""
+
+import asyncio
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from base import LLMProvider, LLMResponse
+
+
+class FakeProvider(LLMProvider):
+    """Provider answering every prompt with a canned response"""
+
+    def __init__(self, **kwargs):
+        super().__init__(model="fake", **kwargs)
+        self.calls = 0
+        self.delay = 0.0
+        self.reply = ""
+
+    async def complete(self, prompt, system_prompt=None, temperature=None, max_tokens=None, **kwargs):
+        return LLMResponse(content=self.reply, model=self.model)
+
+    async def chat(self, messages, temperature=None, max_tokens=None, **kwargs):
+        return await self.complete(messages[-1].content)
+
+    def get_token_count(self, text):
+        return len(text) // 4
+
+    async def send(self, key, content):
+        async def request():
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return LLMResponse(content=content, model=self.model, metadata={"id": self.calls})
+
+        return await self._dedup_chat(key, request)
+
+
+class TestCompleteJson:
+    """Tests for LLMProvider.complete_json"""
+
+    @pytest.fixture
+    def provider(self):
+        return FakeProvider()
+
+    @pytest.mark.parametrize("reply", [
+        '{"a": 1}',
+        '```json\n{"a": 1}\n```',
+        '```\n{"a": 1}\n```',
+        '  ```json{"a": 1}```  ',
+        '```json\n{"a": 1}',
+        '{"a": 1}\n```',
+    ])
+    def test_strips_code_fences(self, provider, reply):
+        provider.reply = reply
+
+        assert asyncio.run(provider.complete_json("prompt")) == {"a": 1}
+
+    def test_invalid_json_raises_value_error(self, provider):
+        provider.reply = "```json\nnot json\n```"
+
+        with pytest.raises(ValueError):
+            asyncio.run(provider.complete_json("prompt"))
+
+
+class TestDedupChat:
+    """Tests for LLMProvider._dedup_chat"""
+
+    @pytest.fixture
+    def provider(self):
+        return FakeProvider(temperature=0.0)
+
+    def test_concurrent_requests_share_one_call(self, provider):
+        async def run():
+            provider.delay = 0.01
+            return await asyncio.gather(*(provider.send(b"key", "ok") for _ in range(3)))
+
+        responses = asyncio.run(run())
+
+        assert [r.content for r in responses] == ["ok", "ok", "ok"]
+        assert provider.calls == 1
+
+    def test_cached_responses_do_not_share_metadata(self, provider):
+        async def run():
+            provider.delay = 0.01
+            first, second = await asyncio.gather(provider.send(b"key", "ok"), provider.send(b"key", "ok"))
+            first.metadata["id"] = "changed"
+            second.metadata["id"] = "changed"
+            return await provider.send(b"key", "ok")
+
+        cached = asyncio.run(run())
+
+        assert cached.metadata == {"id": 1}
+        assert provider.calls == 1
+
+    def test_waiter_retries_when_leader_cancelled(self, provider):
+        async def run():
+            provider.delay = 0.05
+            leader = asyncio.create_task(provider.send(b"key", "ok"))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(provider.send(b"key", "ok"))
+            await asyncio.sleep(0.01)
+
+            leader.cancel()
+            response = await waiter
+
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return response
+
+        response = asyncio.run(run())
+
+        assert response.content == "ok"
+        assert provider.calls == 2
+        assert provider._inflight == {}
+
+    def test_cancelled_waiter_leaves_leader_running(self, provider):
+        async def run():
+            provider.delay = 0.05
+            leader = asyncio.create_task(provider.send(b"key", "ok"))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(provider.send(b"key", "ok"))
+            await asyncio.sleep(0.01)
+
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            return await leader
+
+        response = asyncio.run(run())
+
+        assert response.content == "ok"
+        assert provider.calls == 1
@@ -3,8 +3,19 @@ Storage Backend Package
 Provides abstraction for local and cloud storage
 """
 
-from .base import StorageBackend
+from .base import StorageBackend, AsyncStorageBackend
 from .local import LocalStorage
 from .gcs import GCSStorage
 
-__all__ = ["StorageBackend", "LocalStorage", "GCSStorage"]
+try:
+    from .gcs_async import AsyncGCSStorage
+except ImportError:
+    AsyncGCSStorage = None
+
+__all__ = [
+    "StorageBackend",
+    "AsyncStorageBackend",
+    "LocalStorage",
+    "GCSStorage",
+    "AsyncGCSStorage",
+]
@@ -4,7 +4,7 @@ Defines the contract for all storage implementations (local, GCS)
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 import logging
 
@@ -34,6 +34,26 @@ class StorageBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def upload_bytes(
+        self,
+        data: Union[bytes, memoryview],
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Upload in-memory data to storage without a local file
+
+        Args:
+            data: File contents
+            remote_path: Destination path in storage
+            metadata: Optional metadata to store with file
+
+        Returns:
+            Storage URI of uploaded file
+        """
+        pass
+
     @abstractmethod
     def download_file(self, remote_path: str, local_path: str) -> str:
         """
@@ -48,6 +68,19 @@ class StorageBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def download_bytes(self, remote_path: str) -> bytes:
+        """
+        Download a file from storage into memory without a local file
+
+        Args:
+            remote_path: Path in storage
+
+        Returns:
+            File contents
+        """
+        pass
+
     @abstractmethod
     def delete_file(self, remote_path: str) -> bool:
         """
@@ -61,6 +94,20 @@ class StorageBackend(ABC):
         """
         pass
 
+    def delete_files(self, remote_paths: List[str]) -> None:
+        """
+        Delete several files from storage, ignoring missing ones
+
+        Args:
+            remote_paths: Paths in storage
+        """
+        for remote_path in remote_paths:
+            self.delete_file(remote_path)
+
+    def close(self) -> None:
+        """Release connections or handles held by the backend"""
+        pass
+
     @abstractmethod
     def list_files(self, prefix: str = "") -> List[str]:
         """
@@ -129,3 +176,139 @@ class StorageBackend(ABC):
             Full URI (e.g., 'gs://bucket/path' or 'file:///path')
         """
         pass
+
+
+class AsyncStorageBackend(ABC):
+    """Abstract base class for async storage backends"""
+
+    @abstractmethod
+    async def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Upload a file to storage
+
+        Args:
+            local_path: Path to local file
+            remote_path: Destination path in storage
+            metadata: Optional metadata to store with file
+
+        Returns:
+            Storage URI of uploaded file
+        """
+        pass
+
+    @abstractmethod
+    async def upload_bytes(
+        self,
+        data: Union[bytes, memoryview],
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Upload in-memory data to storage without a local file
+
+        Args:
+            data: File contents
+            remote_path: Destination path in storage
+            metadata: Optional metadata to store with file
+
+        Returns:
+            Storage URI of uploaded file
+        """
+        pass
+
+    @abstractmethod
+    async def download_file(self, remote_path: str, local_path: str) -> str:
+        """
+        Download a file from storage
+
+        Args:
+            remote_path: Path in storage
+            local_path: Local destination path
+
+        Returns:
+            Local file path
+        """
+        pass
+
+    @abstractmethod
+    async def download_bytes(self, remote_path: str) -> bytes:
+        """
+        Download a file from storage into memory without a local file
+
+        Args:
+            remote_path: Path in storage
+
+        Returns:
+            File contents
+        """
+        pass
+
+    @abstractmethod
+    async def delete_file(self, remote_path: str) -> bool:
+        """
+        Delete a file from storage
+
+        Args:
+            remote_path: Path in storage
+
+        Returns:
+            True if deleted successfully
+        """
+        pass
+
+    @abstractmethod
+    async def list_files(self, prefix: str = "") -> List[str]:
+        """
+        List files in storage with optional prefix filter
+
+        Args:
+            prefix: Path prefix to filter by
+
+        Returns:
+            List of file paths
+        """
+        pass
+
+    @abstractmethod
+    async def file_exists(self, remote_path: str) -> bool:
+        """
+        Check if file exists in storage
+
+        Args:
+            remote_path: Path in storage
+
+        Returns:
+            True if file exists
+        """
+        pass
+
+    @abstractmethod
+    async def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
+        """
+        Get metadata for a file
+
+        Args:
+            remote_path: Path in storage
+
+        Returns:
+            Dictionary of metadata
+        """
+        pass
+
+    @abstractmethod
+    def get_uri(self, remote_path: str) -> str:
+        """
+        Get the full URI for a remote path
+
+        Args:
+            remote_path: Path in storage
+
+        Returns:
+            Full URI (e.g., 'gs://bucket/path')
+        """
+        pass
@@ -3,9 +3,16 @@ Google Cloud Storage Backend
 For production deployment on Kaggle/GCP
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import timedelta
+from typing import Optional, List, Dict, Any, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import io
 import logging
+import mimetypes
+import os
+import time
+import uuid
 
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
@@ -14,6 +21,31 @@ from .base import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+# Number of prefixes listed in parallel by get_stats
+STATS_WORKERS = 16
+
+# Resumable upload chunk size, also the part size of composite uploads
+UPLOAD_CHUNK_SIZE = 8 << 20
+# Files larger than this are uploaded as parallel parts and composed
+COMPOSE_THRESHOLD = 64 << 20
+# GCS composes at most 32 source objects per request
+MAX_COMPOSE_SOURCES = 32
+# Number of parts uploaded in parallel
+UPLOAD_WORKERS = 8
+
+# Upload integrity check; CRC32C runs in the google-crc32c C extension
+UPLOAD_CHECKSUM = "crc32c"
+
+# GCS accepts at most 100 calls per batch request
+DELETE_BATCH_SIZE = 100
+
+# Signed URL expiry times are rounded up to this many seconds, so calls
+# within the same window reuse one signature
+SIGNED_URL_BUCKET_SECONDS = 300
+SIGNED_URL_CACHE_SIZE = 1024
+# Longest validity GCS accepts for V4 signatures (7 days)
+MAX_SIGNED_URL_SECONDS = 7 * 86400
+
 
 class GCSStorage(StorageBackend):
     """Google Cloud Storage implementation"""
@@ -36,6 +68,9 @@ class GCSStorage(StorageBackend):
                 self.client = storage.Client()
 
             self.bucket = self.client.bucket(bucket_name)
+
+            # Signed URLs keyed by (remote_path, rounded expiry timestamp)
+            self._signed_urls: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
             logger.info(f"Initialized GCS storage: gs://{bucket_name}")
 
         except Exception as e:
@@ -50,33 +85,110 @@ class GCSStorage(StorageBackend):
     ) -> str:
         """Upload file to GCS"""
         try:
-            blob = self.bucket.blob(remote_path)
+            size = os.path.getsize(local_path)
+
+            if size > COMPOSE_THRESHOLD:
+                self._composite_upload(local_path, remote_path, size, metadata)
+            else:
+                blob = self.bucket.blob(remote_path, chunk_size=UPLOAD_CHUNK_SIZE)
+
+                # Set metadata if provided
+                if metadata:
+                    blob.metadata = metadata
+
+                # Upload file
+                blob.upload_from_filename(local_path, checksum=UPLOAD_CHECKSUM)
+
+            uri = self.get_uri(remote_path)
+            logger.info(f"Uploaded: {local_path} -> {uri}")
+            return uri
+
+        except Exception as e:
+            logger.error(f"GCS upload failed: {e}")
+            raise
+
+    def upload_bytes(
+        self,
+        data: Union[bytes, memoryview],
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Upload in-memory data to GCS"""
+        try:
+            blob = self.bucket.blob(remote_path, chunk_size=UPLOAD_CHUNK_SIZE)
 
             # Set metadata if provided
             if metadata:
                 blob.metadata = metadata
 
-            # Upload file
-            blob.upload_from_filename(local_path)
+            blob.upload_from_file(io.BytesIO(data), size=len(data), checksum=UPLOAD_CHECKSUM)
 
             uri = self.get_uri(remote_path)
-            logger.info(f"Uploaded: {local_path} -> {uri}")
+            logger.info(f"Uploaded {len(data)} bytes -> {uri}")
             return uri
 
         except Exception as e:
             logger.error(f"GCS upload failed: {e}")
             raise
 
+    def _composite_upload(
+        self,
+        local_path: str,
+        remote_path: str,
+        size: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Upload a large file as parallel parts composed into one object
+
+        Args:
+            local_path: Path to local file
+            remote_path: Destination path in storage
+            size: Size of the local file in bytes
+            metadata: Optional metadata for the composed object
+        """
+        offsets = range(0, size, UPLOAD_CHUNK_SIZE)
+        part_prefix = f"{remote_path}.parts-{uuid.uuid4().hex}/"
+        parts = [self.bucket.blob(f"{part_prefix}{i:05d}") for i in range(len(offsets))]
+
+        def upload_part(index: int) -> None:
+            offset = offsets[index]
+            with open(local_path, "rb") as f:
+                f.seek(offset)
+                # Parts fit in a single multipart request, read straight from the file
+                parts[index].upload_from_file(
+                    f,
+                    size=min(UPLOAD_CHUNK_SIZE, size - offset),
+                    checksum=UPLOAD_CHECKSUM
+                )
+
+        try:
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+                list(executor.map(upload_part, range(len(parts))))
+
+            blob = self.bucket.blob(remote_path)
+            blob.content_type = mimetypes.guess_type(local_path)[0] or "application/octet-stream"
+            if metadata:
+                blob.metadata = metadata
+
+            # Compose in batches, folding the object built so far into the next batch
+            blob.compose(parts[:MAX_COMPOSE_SOURCES])
+            for start in range(MAX_COMPOSE_SOURCES, len(parts), MAX_COMPOSE_SOURCES - 1):
+                blob.compose([blob] + parts[start:start + MAX_COMPOSE_SOURCES - 1])
+
+        finally:
+            self.bucket.delete_blobs(parts, on_error=lambda blob: None)
+
     def download_file(self, remote_path: str, local_path: str) -> str:
         """Download file from GCS"""
         try:
             blob = self.bucket.blob(remote_path)
 
-            if not blob.exists():
+            try:
+                blob.download_to_filename(local_path)
+            except NotFound:
                 raise FileNotFoundError(f"File not found in GCS: {remote_path}")
 
-            blob.download_to_filename(local_path)
-
             logger.info(f"Downloaded: gs://{self.bucket_name}/{remote_path} -> {local_path}")
             return local_path
 
@@ -84,21 +196,55 @@ class GCSStorage(StorageBackend):
             logger.error(f"GCS download failed: {e}")
             raise
 
+    def download_bytes(self, remote_path: str) -> bytes:
+        """Download file from GCS into memory"""
+        try:
+            blob = self.bucket.blob(remote_path)
+
+            try:
+                data = blob.download_as_bytes()
+            except NotFound:
+                raise FileNotFoundError(f"File not found in GCS: {remote_path}")
+
+            logger.info(f"Downloaded {len(data)} bytes: gs://{self.bucket_name}/{remote_path}")
+            return data
+
+        except Exception as e:
+            logger.error(f"GCS download failed: {e}")
+            raise
+
     def delete_file(self, remote_path: str) -> bool:
         """Delete file from GCS"""
         try:
             blob = self.bucket.blob(remote_path)
 
-            if blob.exists():
+            try:
                 blob.delete()
-                logger.info(f"Deleted: gs://{self.bucket_name}/{remote_path}")
-                return True
-            return False
+            except NotFound:
+                return False
+
+            logger.info(f"Deleted: gs://{self.bucket_name}/{remote_path}")
+            return True
 
         except Exception as e:
             logger.error(f"GCS delete failed: {e}")
             return False
 
+    def delete_files(self, remote_paths: List[str]) -> None:
+        """Delete files from GCS in batch requests, ignoring missing ones"""
+        try:
+            for start in range(0, len(remote_paths), DELETE_BATCH_SIZE):
+                # Missing objects fail their own sub-request only
+                with self.client.batch(raise_exception=False):
+                    for remote_path in remote_paths[start:start + DELETE_BATCH_SIZE]:
+                        self.bucket.blob(remote_path).delete()
+
+            logger.info(f"Deleted {len(remote_paths)} files from gs://{self.bucket_name}")
+
+        except Exception as e:
+            logger.error(f"GCS batch delete failed: {e}")
+            raise
+
     def list_files(self, prefix: str = "") -> List[str]:
         """List files in GCS with optional prefix"""
         try:
@@ -123,33 +269,102 @@ class GCSStorage(StorageBackend):
         try:
             blob = self.bucket.blob(remote_path)
 
-            if not blob.exists():
+            # Reload to get latest metadata
+            try:
+                blob.reload()
+            except NotFound:
                 raise FileNotFoundError(f"File not found in GCS: {remote_path}")
 
-            # Reload to get latest metadata
-            blob.reload()
-
-            metadata = {
-                "name": blob.name,
-                "path": remote_path,
-                "size_bytes": blob.size,
-                "created_at": blob.time_created.isoformat() if blob.time_created else None,
-                "modified_at": blob.updated.isoformat() if blob.updated else None,
-                "mime_type": blob.content_type,
-                "md5_hash": blob.md5_hash,
-                "etag": blob.etag,
-                "generation": blob.generation,
-            }
+            return self._blob_metadata(blob, remote_path)
+
+        except Exception as e:
+            logger.error(f"GCS get metadata failed: {e}")
+            return {}
 
-            # Add custom metadata if present
-            if blob.metadata:
-                metadata.update(blob.metadata)
+    @staticmethod
+    def _blob_metadata(blob: storage.Blob, remote_path: str) -> Dict[str, Any]:
+        """Build the metadata dictionary for a loaded blob"""
+        metadata = {
+            "name": blob.name,
+            "path": remote_path,
+            "size_bytes": blob.size,
+            "created_at": blob.time_created.isoformat() if blob.time_created else None,
+            "modified_at": blob.updated.isoformat() if blob.updated else None,
+            "mime_type": blob.content_type,
+            "md5_hash": blob.md5_hash,
+            "etag": blob.etag,
+            "generation": blob.generation,
+        }
+
+        # Add custom metadata if present
+        if blob.metadata:
+            metadata.update(blob.metadata)
+
+        return metadata
+
+    def describe(
+        self,
+        remote_path: str,
+        expiration_seconds: int = 3600
+    ) -> Dict[str, Any]:
+        """
+        Get file metadata and a signed URL with a single metadata request
 
+        Args:
+            remote_path: Path to file
+            expiration_seconds: Minimum URL validity
+
+        Returns:
+            Metadata dictionary with an added "signed_url" entry
+        """
+        try:
+            blob = self.bucket.blob(remote_path)
+
+            try:
+                blob.reload()
+            except NotFound:
+                raise FileNotFoundError(f"File not found in GCS: {remote_path}")
+
+            metadata = self._blob_metadata(blob, remote_path)
+            metadata["signed_url"] = self._signed_url(blob, remote_path, expiration_seconds)
             return metadata
 
         except Exception as e:
-            logger.error(f"GCS get metadata failed: {e}")
-            return {}
+            logger.error(f"GCS describe failed: {e}")
+            raise
+
+    def _signed_url(
+        self,
+        blob: storage.Blob,
+        remote_path: str,
+        expiration_seconds: int
+    ) -> str:
+        """
+        Sign a GET URL for a blob, reusing signatures within an expiry window
+
+        The expiry is rounded up to SIGNED_URL_BUCKET_SECONDS, so a cached
+        URL always stays valid for at least expiration_seconds.
+        """
+        now = int(time.time())
+        expires_at = -(-(now + expiration_seconds) // SIGNED_URL_BUCKET_SECONDS)
+        expires_at = min(expires_at * SIGNED_URL_BUCKET_SECONDS, now + MAX_SIGNED_URL_SECONDS)
+        key = (remote_path, expires_at)
+
+        url = self._signed_urls.get(key)
+        if url is not None:
+            self._signed_urls.move_to_end(key)
+            return url
+
+        url = blob.generate_signed_url(
+            version="v4",
+            expiration=datetime.fromtimestamp(expires_at, tz=timezone.utc),
+            method="GET"
+        )
+
+        self._signed_urls[key] = url
+        if len(self._signed_urls) > SIGNED_URL_CACHE_SIZE:
+            self._signed_urls.popitem(last=False)
+        return url
 
     def generate_signed_url(
         self,
@@ -163,11 +378,7 @@ class GCSStorage(StorageBackend):
             if not blob.exists():
                 raise FileNotFoundError(f"File not found in GCS: {remote_path}")
 
-            url = blob.generate_signed_url(
-                version="v4",
-                expiration=timedelta(seconds=expiration_seconds),
-                method="GET"
-            )
+            url = self._signed_url(blob, remote_path, expiration_seconds)
 
             logger.info(f"Generated signed URL for: {remote_path}")
             return url
@@ -216,28 +427,35 @@ class GCSStorage(StorageBackend):
         """
         try:
             blob = self.bucket.blob(remote_path)
+            blob.metadata = metadata
 
-            if not blob.exists():
+            try:
+                blob.patch()
+            except NotFound:
                 raise FileNotFoundError(f"File not found in GCS: {remote_path}")
 
-            blob.metadata = metadata
-            blob.patch()
-
             logger.info(f"Updated metadata for: {remote_path}")
 
         except Exception as e:
             logger.error(f"GCS set metadata failed: {e}")
             raise
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get storage statistics"""
-        try:
-            total_size = 0
-            file_count = 0
+    def get_stats(self, fast: bool = False) -> Dict[str, Any]:
+        """
+        Get storage statistics
+
+        Args:
+            fast: Read bucket size and object count from Cloud Monitoring
+                instead of listing objects (values lag by up to a day)
 
-            for blob in self.bucket.list_blobs():
-                total_size += blob.size or 0
-                file_count += 1
+        Returns:
+            Dictionary of storage statistics
+        """
+        try:
+            totals = self._get_monitoring_totals() if fast else None
+            if totals is None:
+                totals = self._list_totals()
+            total_size, file_count = totals
 
             return {
                 "backend": "gcs",
@@ -255,3 +473,85 @@ class GCSStorage(StorageBackend):
                 "bucket": self.bucket_name,
                 "error": str(e)
             }
+
+    def _list_totals(self) -> Tuple[int, int]:
+        """Sum object sizes and counts, listing top-level prefixes in parallel"""
+        # Objects directly under the bucket root; the iterator collects
+        # the top-level prefixes while paging
+        iterator = self.bucket.list_blobs(delimiter="/")
+        total_size, file_count = self._sum_blobs(iterator)
+        prefixes = sorted(iterator.prefixes)
+
+        if prefixes:
+            with ThreadPoolExecutor(max_workers=min(STATS_WORKERS, len(prefixes))) as executor:
+                for size, count in executor.map(self._count_prefix, prefixes):
+                    total_size += size
+                    file_count += count
+
+        return total_size, file_count
+
+    def _count_prefix(self, prefix: str) -> Tuple[int, int]:
+        """Sum object sizes and counts under a prefix"""
+        return self._sum_blobs(self.bucket.list_blobs(prefix=prefix))
+
+    @staticmethod
+    def _sum_blobs(blobs) -> Tuple[int, int]:
+        """Sum sizes and count blobs from an iterable"""
+        total_size = 0
+        file_count = 0
+        for blob in blobs:
+            total_size += blob.size or 0
+            file_count += 1
+        return total_size, file_count
+
+    def _get_monitoring_totals(self) -> Optional[Tuple[int, int]]:
+        """
+        Read latest bucket size and object count from Cloud Monitoring
+
+        Returns:
+            (total_size_bytes, file_count), or None if unavailable
+        """
+        try:
+            from google.cloud import monitoring_v3
+        except ImportError:
+            logger.warning("google-cloud-monitoring not installed, listing objects instead")
+            return None
+
+        project = self.project_id or self.client.project
+        now = int(time.time())
+        # Storage metrics are sampled once a day
+        interval = monitoring_v3.TimeInterval(
+            {"end_time": {"seconds": now}, "start_time": {"seconds": now - 2 * 86400}}
+        )
+        metric_client = monitoring_v3.MetricServiceClient()
+
+        def latest_sum(metric: str) -> Optional[float]:
+            series_list = metric_client.list_time_series(
+                request={
+                    "name": f"projects/{project}",
+                    "filter": (
+                        f'metric.type = "storage.googleapis.com/storage/{metric}" '
+                        f'AND resource.labels.bucket_name = "{self.bucket_name}"'
+                    ),
+                    "interval": interval,
+                    "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+                }
+            )
+            total = None
+            # One series per storage class; points are newest first
+            for series in series_list:
+                if series.points:
+                    value = series.points[0].value
+                    total = (total or 0) + (value.double_value or value.int64_value)
+            return total
+
+        try:
+            total_size = latest_sum("total_bytes")
+            file_count = latest_sum("object_count")
+        except Exception as e:
+            logger.warning(f"Cloud Monitoring query failed, listing objects instead: {e}")
+            return None
+
+        if total_size is None or file_count is None:
+            return None
+        return int(total_size), int(file_count)
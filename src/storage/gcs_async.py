@@ -0,0 +1,234 @@
+"""
+Async Google Cloud Storage Backend
+Coroutine-based GCS access for the async agent pipeline
+"""
+
+from typing import Optional, List, Dict, Any, Union
+import asyncio
+import logging
+
+import aiohttp
+from gcloud.aio.storage import Storage
+
+from .base import AsyncStorageBackend
+
+logger = logging.getLogger(__name__)
+
+# Maximum open connections in the shared session
+CONNECTION_LIMIT = 100
+
+
+class AsyncGCSStorage(AsyncStorageBackend):
+    """Google Cloud Storage implementation on a shared aiohttp session"""
+
+    # One connection pool per event loop shared by all instances, created on first use
+    _sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    def __init__(self, bucket_name: str, project_id: Optional[str] = None):
+        """
+        Initialize async GCS storage
+
+        Args:
+            bucket_name: Name of the GCS bucket
+            project_id: GCP project ID (optional, uses default if not provided)
+        """
+        self.bucket_name = bucket_name
+        self.project_id = project_id
+        self._storage: Optional[Storage] = None
+        self._storage_session: Optional[aiohttp.ClientSession] = None
+
+        logger.info(f"Initialized async GCS storage: gs://{bucket_name}")
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared session of the running loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            # Drop sessions of loops that have finished (e.g. earlier asyncio.run calls)
+            for closed in [other for other in cls._sessions if other.is_closed()]:
+                del cls._sessions[closed]
+            session = cls._sessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
+            )
+        return session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared session of the running event loop"""
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    @property
+    def storage(self) -> Storage:
+        """GCS client bound to the shared session of the running loop"""
+        session = self._get_session()
+        if self._storage_session is not session:
+            self._storage = Storage(session=session)
+            self._storage_session = session
+        return self._storage
+
+    async def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Upload file to GCS"""
+        try:
+            await self.storage.upload_from_filename(
+                self.bucket_name,
+                remote_path,
+                local_path,
+                metadata={"metadata": metadata} if metadata else None
+            )
+
+            uri = self.get_uri(remote_path)
+            logger.info(f"Uploaded: {local_path} -> {uri}")
+            return uri
+
+        except Exception as e:
+            logger.error(f"GCS upload failed: {e}")
+            raise
+
+    async def upload_bytes(
+        self,
+        data: Union[bytes, memoryview],
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Upload in-memory data to GCS"""
+        try:
+            await self.storage.upload(
+                self.bucket_name,
+                remote_path,
+                bytes(data),
+                metadata={"metadata": metadata} if metadata else None
+            )
+
+            uri = self.get_uri(remote_path)
+            logger.info(f"Uploaded {len(data)} bytes -> {uri}")
+            return uri
+
+        except Exception as e:
+            logger.error(f"GCS upload failed: {e}")
+            raise
+
+    async def download_file(self, remote_path: str, local_path: str) -> str:
+        """Download file from GCS"""
+        try:
+            try:
+                await self.storage.download_to_filename(
+                    self.bucket_name, remote_path, local_path
+                )
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    raise FileNotFoundError(f"File not found in GCS: {remote_path}")
+                raise
+
+            logger.info(f"Downloaded: gs://{self.bucket_name}/{remote_path} -> {local_path}")
+            return local_path
+
+        except Exception as e:
+            logger.error(f"GCS download failed: {e}")
+            raise
+
+    async def download_bytes(self, remote_path: str) -> bytes:
+        """Download file from GCS into memory"""
+        try:
+            try:
+                data = await self.storage.download(self.bucket_name, remote_path)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    raise FileNotFoundError(f"File not found in GCS: {remote_path}")
+                raise
+
+            logger.info(f"Downloaded {len(data)} bytes: gs://{self.bucket_name}/{remote_path}")
+            return data
+
+        except Exception as e:
+            logger.error(f"GCS download failed: {e}")
+            raise
+
+    async def delete_file(self, remote_path: str) -> bool:
+        """Delete file from GCS"""
+        try:
+            await self.storage.delete(self.bucket_name, remote_path)
+
+            logger.info(f"Deleted: gs://{self.bucket_name}/{remote_path}")
+            return True
+
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                logger.error(f"GCS delete failed: {e}")
+            return False
+
+        except Exception as e:
+            logger.error(f"GCS delete failed: {e}")
+            return False
+
+    async def list_files(self, prefix: str = "") -> List[str]:
+        """List files in GCS with optional prefix"""
+        try:
+            files = []
+            params = {"prefix": prefix, "fields": "items(name),nextPageToken"}
+
+            while True:
+                page = await self.storage.list_objects(self.bucket_name, params=params)
+                files.extend(item["name"] for item in page.get("items", ()))
+
+                page_token = page.get("nextPageToken")
+                if not page_token:
+                    break
+                params["pageToken"] = page_token
+
+            return sorted(files)
+
+        except Exception as e:
+            logger.error(f"GCS list files failed: {e}")
+            return []
+
+    async def file_exists(self, remote_path: str) -> bool:
+        """Check if file exists in GCS"""
+        try:
+            await self.storage.download_metadata(self.bucket_name, remote_path)
+            return True
+        except Exception:
+            return False
+
+    async def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
+        """Get file metadata from GCS"""
+        try:
+            try:
+                resource = await self.storage.download_metadata(self.bucket_name, remote_path)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    raise FileNotFoundError(f"File not found in GCS: {remote_path}")
+                raise
+
+            metadata = {
+                "name": resource.get("name"),
+                "path": remote_path,
+                "size_bytes": int(resource["size"]) if "size" in resource else None,
+                "created_at": resource.get("timeCreated"),
+                "modified_at": resource.get("updated"),
+                "mime_type": resource.get("contentType"),
+                "md5_hash": resource.get("md5Hash"),
+                "etag": resource.get("etag"),
+                "generation": int(resource["generation"]) if "generation" in resource else None,
+            }
+
+            # Add custom metadata if present
+            if resource.get("metadata"):
+                metadata.update(resource["metadata"])
+
+            return metadata
+
+        except Exception as e:
+            logger.error(f"GCS get metadata failed: {e}")
+            return {}
+
+    def get_uri(self, remote_path: str) -> str:
+        """Get gs:// URI for GCS path"""
+        return f"gs://{self.bucket_name}/{remote_path}"
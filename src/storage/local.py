@@ -3,17 +3,57 @@ Local Filesystem Storage Backend
 For local development and testing
 """
 
+import os
 import shutil
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union, Iterator, Tuple
 from datetime import datetime
-import json
 import logging
+import mimetypes
+import sqlite3
+import threading
+
+import orjson
 
 from .base import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+# Metadata index kept in base_dir, alongside its WAL and shared-memory files
+INDEX_FILE = "index.sqlite"
+
+# Per-file metadata sidecars used before the index, migrated on first open
+_SIDECAR_SUFFIX = ".metadata.json"
+
+# MIME types for the file kinds this app stores; others go through mimetypes
+_MIME = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+    ".txt": "text/plain",
+    ".json": "application/json",
+    ".html": "text/html",
+    ".md": "text/markdown",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+mimetypes.init()
+
+
+def _dump_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize metadata for the index's TEXT column"""
+    return orjson.dumps(
+        metadata,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _load_metadata(data: Union[bytes, str]) -> Dict[str, Any]:
+    """Deserialize metadata from the index"""
+    return orjson.loads(data)
+
 
 class LocalStorage(StorageBackend):
     """Local filesystem storage implementation"""
@@ -34,8 +74,34 @@ class LocalStorage(StorageBackend):
         (self.base_dir / "sessions").mkdir(exist_ok=True)
         (self.base_dir / "temp").mkdir(exist_ok=True)
 
+        # Custom metadata for all files lives in one SQLite index
+        self._db = sqlite3.connect(
+            str(self.base_dir / INDEX_FILE),
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "remote_path TEXT PRIMARY KEY, metadata_json TEXT NOT NULL, "
+            "size INTEGER, mtime REAL)"
+        )
+        self._db_lock = threading.Lock()
+
+        if self._db.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self._migrate_sidecars()
+            self._db.execute("PRAGMA user_version = 1")
+
+        self._base_uri = f"file://{self.base_dir}"
+
         logger.info(f"Initialized local storage at: {self.base_dir}")
 
+    def close(self) -> None:
+        """Close the metadata index"""
+        with self._db_lock:
+            self._db.close()
+
     def upload_file(
         self,
         local_path: str,
@@ -48,7 +114,7 @@ class LocalStorage(StorageBackend):
             if not source.exists():
                 raise FileNotFoundError(f"Source file not found: {local_path}")
 
-            destination = self.base_dir / remote_path
+            destination = self._resolve(remote_path)
             destination.parent.mkdir(parents=True, exist_ok=True)
 
             # Copy file
@@ -65,10 +131,34 @@ class LocalStorage(StorageBackend):
             logger.error(f"Upload failed: {e}")
             raise
 
+    def upload_bytes(
+        self,
+        data: Union[bytes, memoryview],
+        remote_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Write in-memory data to local storage"""
+        try:
+            destination = self._resolve(remote_path)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+
+            destination.write_bytes(data)
+
+            # Store metadata if provided
+            if metadata:
+                self._save_metadata(destination, metadata)
+
+            logger.info(f"Uploaded {len(data)} bytes -> {destination}")
+            return self.get_uri(remote_path)
+
+        except Exception as e:
+            logger.error(f"Upload failed: {e}")
+            raise
+
     def download_file(self, remote_path: str, local_path: str) -> str:
         """Download file from local storage (essentially a copy)"""
         try:
-            source = self.base_dir / remote_path
+            source = self._resolve(remote_path)
             if not source.exists():
                 raise FileNotFoundError(f"File not found: {remote_path}")
 
@@ -84,17 +174,35 @@ class LocalStorage(StorageBackend):
             logger.error(f"Download failed: {e}")
             raise
 
+    def download_bytes(self, remote_path: str) -> bytes:
+        """Read file from local storage into memory"""
+        try:
+            source = self._resolve(remote_path)
+            if not source.exists():
+                raise FileNotFoundError(f"File not found: {remote_path}")
+
+            data = source.read_bytes()
+
+            logger.info(f"Downloaded {len(data)} bytes: {source}")
+            return data
+
+        except Exception as e:
+            logger.error(f"Download failed: {e}")
+            raise
+
     def delete_file(self, remote_path: str) -> bool:
         """Delete file from local storage"""
         try:
-            file_path = self.base_dir / remote_path
+            file_path = self._resolve(remote_path)
             if file_path.exists():
                 file_path.unlink()
 
                 # Also delete metadata if exists
-                metadata_path = self._get_metadata_path(file_path)
-                if metadata_path.exists():
-                    metadata_path.unlink()
+                with self._db_lock:
+                    self._db.execute(
+                        "DELETE FROM files WHERE remote_path = ?",
+                        (self._index_key(file_path),)
+                    )
 
                 logger.info(f"Deleted: {file_path}")
                 return True
@@ -104,18 +212,36 @@ class LocalStorage(StorageBackend):
             logger.error(f"Delete failed: {e}")
             return False
 
+    def delete_files(self, remote_paths: List[str]) -> None:
+        """Delete files from local storage, ignoring missing ones"""
+        try:
+            deleted_keys = []
+            for remote_path in remote_paths:
+                file_path = self._resolve(remote_path)
+                try:
+                    file_path.unlink()
+                except FileNotFoundError:
+                    continue
+                deleted_keys.append((self._index_key(file_path),))
+
+            # Drop metadata for all deleted files in one statement batch
+            with self._db_lock:
+                self._db.executemany("DELETE FROM files WHERE remote_path = ?", deleted_keys)
+
+            logger.info(f"Deleted {len(deleted_keys)} files from {self.base_dir}")
+
+        except Exception as e:
+            logger.error(f"Batch delete failed: {e}")
+            raise
+
     def list_files(self, prefix: str = "") -> List[str]:
         """List files with optional prefix"""
         try:
-            search_dir = self.base_dir / prefix if prefix else self.base_dir
-            if not search_dir.exists():
+            search_dir = self._resolve(prefix) if prefix else self.base_dir
+            if not search_dir.is_dir():
                 return []
 
-            files = []
-            for file_path in search_dir.rglob("*"):
-                if file_path.is_file() and not file_path.name.endswith(".metadata.json"):
-                    relative_path = file_path.relative_to(self.base_dir)
-                    files.append(str(relative_path))
+            files = [relative_path for relative_path, _ in self._iter_files(str(search_dir))]
 
             return sorted(files)
 
@@ -125,22 +251,23 @@ class LocalStorage(StorageBackend):
 
     def file_exists(self, remote_path: str) -> bool:
         """Check if file exists"""
-        file_path = self.base_dir / remote_path
+        file_path = self._resolve(remote_path)
         return file_path.exists() and file_path.is_file()
 
     def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
         """Get file metadata"""
         try:
-            file_path = self.base_dir / remote_path
+            file_path = self._resolve(remote_path)
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {remote_path}")
 
             # Load custom metadata if exists
-            metadata_path = self._get_metadata_path(file_path)
-            custom_metadata = {}
-            if metadata_path.exists():
-                with open(metadata_path, "r") as f:
-                    custom_metadata = json.load(f)
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT metadata_json FROM files WHERE remote_path = ?",
+                    (self._index_key(file_path),)
+                ).fetchone()
+            custom_metadata = _load_metadata(row[0]) if row else {}
 
             # Get file stats
             stats = file_path.stat()
@@ -170,42 +297,121 @@ class LocalStorage(StorageBackend):
         Generate a 'signed' URL (for local, just returns file:// URI)
         Note: This is a simplified version for local dev
         """
-        file_path = self.base_dir / remote_path
+        file_path = self._resolve(remote_path)
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {remote_path}")
 
-        return f"file://{file_path.absolute()}"
+        return f"{self._base_uri}/{remote_path}"
 
     def get_uri(self, remote_path: str) -> str:
         """Get file:// URI for local path"""
-        file_path = self.base_dir / remote_path
-        return f"file://{file_path.absolute()}"
+        self._resolve(remote_path)
+        return f"{self._base_uri}/{remote_path}"
+
+    def _resolve(self, remote_path: str) -> Path:
+        """
+        Get the local path for a storage path
+
+        Raises:
+            ValueError: If the path is absolute or contains '..'
+        """
+        if os.path.isabs(remote_path) or ".." in remote_path.replace(os.sep, "/").split("/"):
+            raise ValueError(f"Path escapes storage directory: {remote_path}")
+        return self.base_dir / remote_path
+
+    def _iter_files(self, root: str) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Walk a directory tree, skipping the metadata index in base_dir
 
-    def _get_metadata_path(self, file_path: Path) -> Path:
-        """Get path for metadata file"""
-        return file_path.parent / f"{file_path.name}.metadata.json"
+        Args:
+            root: Directory to walk
+
+        Yields:
+            (path relative to base_dir, directory entry) for each file
+        """
+        base = str(self.base_dir)
+        offset = len(base) + 1
+        stack = [root]
+
+        while stack:
+            directory = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and not (
+                        directory == base and entry.name.startswith(INDEX_FILE)
+                    ):
+                        yield entry.path[offset:], entry
+
+    def _index_key(self, file_path: Path) -> str:
+        """Get metadata index key for a stored file"""
+        return str(file_path.relative_to(self.base_dir))
 
     def _save_metadata(self, file_path: Path, metadata: Dict[str, Any]) -> None:
-        """Save metadata to companion file"""
-        metadata_path = self._get_metadata_path(file_path)
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        """Save metadata to the index"""
+        stats = file_path.stat()
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files (remote_path, metadata_json, size, mtime) "
+                "VALUES (?, ?, ?, ?)",
+                (self._index_key(file_path), _dump_metadata(metadata), stats.st_size, stats.st_mtime)
+            )
+
+    def _migrate_sidecars(self) -> None:
+        """Move metadata from legacy *.metadata.json sidecar files into the index"""
+        rows = []
+        sidecars = []
+
+        for relative_path, entry in self._iter_files(str(self.base_dir)):
+            if not entry.name.endswith(_SIDECAR_SUFFIX):
+                continue
+            file_path = Path(entry.path[:-len(_SIDECAR_SUFFIX)])
+            if not file_path.is_file():
+                continue
+
+            try:
+                metadata = _load_metadata(Path(entry.path).read_bytes())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable metadata file {relative_path}: {e}")
+                continue
+
+            stats = file_path.stat()
+            rows.append(
+                (self._index_key(file_path), _dump_metadata(metadata), stats.st_size, stats.st_mtime)
+            )
+            sidecars.append(Path(entry.path))
+
+        if not rows:
+            return
+
+        # Metadata already in the index is newer than its sidecar
+        self._db.executemany(
+            "INSERT OR IGNORE INTO files (remote_path, metadata_json, size, mtime) "
+            "VALUES (?, ?, ?, ?)",
+            rows
+        )
+        for sidecar in sidecars:
+            sidecar.unlink(missing_ok=True)
+
+        logger.info(f"Migrated {len(rows)} metadata files into {INDEX_FILE}")
 
     def _guess_mime_type(self, file_path: Path) -> str:
         """Guess MIME type from file extension"""
-        import mimetypes
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        return mime_type or "application/octet-stream"
+        return (
+            _MIME.get(file_path.suffix.lower())
+            or mimetypes.guess_type(file_path.name)[0]
+            or "application/octet-stream"
+        )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
         total_size = 0
         file_count = 0
 
-        for file_path in self.base_dir.rglob("*"):
-            if file_path.is_file() and not file_path.name.endswith(".metadata.json"):
-                total_size += file_path.stat().st_size
-                file_count += 1
+        for _, entry in self._iter_files(str(self.base_dir)):
+            total_size += entry.stat().st_size
+            file_count += 1
 
         return {
             "backend": "local",
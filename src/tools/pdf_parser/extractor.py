@@ -10,6 +10,71 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Entries within a section are separated by blank lines
+_ENTRY_SPLIT_RE = re.compile(r"\n\s*\n")
+
+# Contact information
+# First non-blank line, ending at any line boundary str.splitlines() knows
+_FIRST_LINE_RE = re.compile(r"[^\s][^\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]*")
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+# Phone (various international formats). A country code needs a leading
+# "+" or a separator on the same line, and area code brackets must pair up,
+# so a run of digits can only be split a few ways and failed matches
+# backtrack less
+_PHONE_RE = re.compile(
+    r"(?:\+\d{1,3}[-.\s]?|\d{1,3}[-. \t])?(?:\(\d{2,4}\)[-.\s]?|\d{2,4}[-.\s]?)?\d{3,4}[-.\s]?\d{4}"
+)
+# Profile handle following a "linkedin.com/in/" or "github.com/" URL prefix
+_HANDLE_RE = re.compile(r"[\w-]+")
+_LINKEDIN_RE = re.compile(r"(?:linkedin\.com/in/|linkedin:?\s*)([\w-]+)", re.IGNORECASE)
+_GITHUB_RE = re.compile(r"(?:github\.com/|github:?\s*)([\w-]+)", re.IGNORECASE)
+_WEBSITE_RE = re.compile(r"https?://(?:www\.)?[\w.-]+\.[a-z]{2,}(?:/[\w.-]*)*", re.IGNORECASE)
+# Location (city, state/country)
+_LOCATION_RE = re.compile(r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2}|[A-Z][a-z]+)")
+
+# Experience: "Position at Company" or "Position | Company", and date ranges
+_POSITION_COMPANY_RE = re.compile(r"(.+?)\s+(?:at|@|\|)\s+(.+)")
+_DATE_RE = re.compile(
+    r"(\d{4}|\w+\s+\d{4})\s*[-–—]\s*(\d{4}|\w+\s+\d{4}|Present|Current)", re.IGNORECASE
+)
+# End-date words meaning the position is ongoing
+_OPEN_ENDED = frozenset({"present", "current"})
+_BULLET_CHARS = ("•", "-", "*")
+
+# Education: degree, date range and GPA, matched in one scan per line
+_EDU_MULTI_RE = re.compile(
+    r"(?P<degree>Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Doctor)"
+    r"|(?P<date>(?P<start>\d{4})\s*[-–—]\s*(?P<end>\d{4}|Present|Expected))"
+    r"|(?P<gpa>GPA:?\s*(?P<gpa_value>\d+\.\d+))",
+    re.IGNORECASE,
+)
+
+# Skills: "Category: skill, skill"
+_SKILL_CATEGORY_RE = re.compile(r"([^:\n]+):\s*([^\n]+)")
+# Maps every skill delimiter to "|" so a plain str.split does the work;
+# category rows never contain newlines, so one table serves both cases
+_SKILL_DELIM_TABLE = str.maketrans({",": "|", ";": "|", "•": "|", "\n": "|"})
+
+# Projects and certifications
+_URL_RE = re.compile(r"https?://[\w.-]+(?:/[\w.-]*)*")
+_ISSUER_SPLIT_RE = re.compile(r"\s+[-–—,]\s+")
+_CERT_DATE_RE = re.compile(r"(\w+\s+\d{4}|\d{4})")
+
+
+def _strip_bullet(line: str) -> Optional[str]:
+    """Return the text after a leading bullet marker, or None if there is none"""
+    stripped = line.lstrip()
+    if stripped[:1] in _BULLET_CHARS:
+        return stripped[1:].strip() or None
+    return None
+
+
+def _search_date(pattern: re.Pattern, line: str) -> Optional[re.Match]:
+    """Search a year-bearing date pattern, skipping lines without any digit"""
+    if not any(map(str.isdigit, line)):
+        return None
+    return pattern.search(line)
+
 
 class CVSectionExtractor:
     """Extract and parse structured sections from CV text"""
@@ -49,6 +114,21 @@ class CVSectionExtractor:
         "awards": [r"awards?", r"honors?", r"achievements?"],
     }
 
+    # All section headers in one pattern, one named group per header pattern
+    # ("<section>__<index>"), so the text is scanned once. The lookahead
+    # keeps matches zero-width, so a header is found from every line start
+    # that reaches it, as with separate per-pattern scans
+    _COMPILED_HEADER_RE = re.compile(
+        r"^(?=[\s\-=]*(?:"
+        + "|".join(
+            f"(?P<{section_name}__{i}>{pattern})"
+            for section_name, patterns in SECTION_PATTERNS.items()
+            for i, pattern in enumerate(patterns)
+        )
+        + r")[\s\-=:]*$)",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
     def extract_sections(self, text: str) -> Dict[str, Any]:
         """
         Extract all CV sections from text
@@ -62,7 +142,7 @@ class CVSectionExtractor:
         sections = {}
 
         # Extract contact information (appears at top of CV)
-        sections["contact"] = self._extract_contact(text[:1000])
+        sections["contact"] = self._extract_contact(text)
 
         # Find section boundaries
         section_boundaries = self._find_section_boundaries(text)
@@ -87,8 +167,8 @@ class CVSectionExtractor:
 
         return sections
 
-    def _extract_contact(self, text: str) -> Dict[str, Optional[str]]:
-        """Extract contact information from CV header"""
+    def _extract_contact(self, text: str, endpos: int = 1000) -> Dict[str, Optional[str]]:
+        """Extract contact information from CV header (the first `endpos` characters)"""
         contact = {
             "name": None,
             "email": None,
@@ -100,75 +180,85 @@ class CVSectionExtractor:
         }
 
         # Name (typically first line or largest text)
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        if lines:
-            # Assume first substantial line is name
-            contact["name"] = lines[0]
+        # Assume first substantial line is name
+        name_match = _FIRST_LINE_RE.search(text, 0, endpos)
+        if name_match:
+            contact["name"] = name_match.group(0).rstrip()
 
         # Email
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text, 0, endpos)
         if email_match:
             contact["email"] = email_match.group(0)
 
-        # Phone (various international formats)
-        phone_pattern = (
-            r"(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}"
-        )
-        phone_match = re.search(phone_pattern, text)
+        # Phone
+        phone_match = _PHONE_RE.search(text, 0, endpos)
         if phone_match:
             contact["phone"] = phone_match.group(0).strip()
 
+        # The profile and website patterns all need a literal keyword, so a
+        # substring check skips their (case-insensitive) scans when it's absent
+        header = text[:endpos].lower()
+
         # LinkedIn
-        linkedin_pattern = r"(?:linkedin\.com/in/|linkedin:?\s*)([\w-]+)"
-        linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
-        if linkedin_match:
-            username = linkedin_match.group(1)
-            contact["linkedin"] = f"https://linkedin.com/in/{username}"
+        if "linkedin" in header:
+            username = self._find_handle(text, "linkedin.com/in/", _LINKEDIN_RE, endpos)
+            if username:
+                contact["linkedin"] = f"https://linkedin.com/in/{username}"
 
         # GitHub
-        github_pattern = r"(?:github\.com/|github:?\s*)([\w-]+)"
-        github_match = re.search(github_pattern, text, re.IGNORECASE)
-        if github_match:
-            username = github_match.group(1)
-            contact["github"] = f"https://github.com/{username}"
+        if "github" in header:
+            username = self._find_handle(text, "github.com/", _GITHUB_RE, endpos)
+            if username:
+                contact["github"] = f"https://github.com/{username}"
 
         # Website
-        website_pattern = r"https?://(?:www\.)?[\w.-]+\.[a-z]{2,}(?:/[\w.-]*)*"
-        for match in re.finditer(website_pattern, text, re.IGNORECASE):
-            url = match.group(0)
-            if "linkedin" not in url.lower() and "github" not in url.lower():
-                contact["website"] = url
-                break
-
-        # Location (city, state/country)
-        location_pattern = r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2}|[A-Z][a-z]+)"
-        location_match = re.search(location_pattern, text)
+        if "http" in header:
+            for match in _WEBSITE_RE.finditer(text, 0, endpos):
+                url = match.group(0)
+                if "linkedin" not in url.lower() and "github" not in url.lower():
+                    contact["website"] = url
+                    break
+
+        # Location
+        location_match = _LOCATION_RE.search(text, 0, endpos)
         if location_match:
             contact["location"] = location_match.group(0)
 
         return contact
 
+    @staticmethod
+    def _find_handle(
+        text: str, url_prefix: str, fallback: re.Pattern, endpos: int
+    ) -> Optional[str]:
+        """
+        Find a profile handle, preferring the one in a profile URL
+
+        Looks for the literal URL prefix first and reads the handle after it;
+        otherwise falls back to the label pattern (e.g. "GitHub: user").
+        """
+        idx = text.find(url_prefix, 0, endpos)
+        if idx >= 0:
+            handle_match = _HANDLE_RE.match(text, idx + len(url_prefix), endpos)
+            if handle_match:
+                return handle_match.group(0)
+
+        fallback_match = fallback.search(text, 0, endpos)
+        return fallback_match.group(1) if fallback_match else None
+
     def _find_section_boundaries(self, text: str) -> Dict[str, Tuple[int, int]]:
         """Find start and end positions of each section"""
         boundaries = {}
         section_positions = []
 
-        # Find all section headers
-        for section_name, patterns in self.SECTION_PATTERNS.items():
-            for pattern in patterns:
-                # Look for section headers (typically on their own line, possibly with decorations)
-                matches = re.finditer(
-                    rf"^[\s\-=]*{pattern}[\s\-=:]*$",
-                    text,
-                    re.MULTILINE | re.IGNORECASE,
-                )
-                for match in matches:
-                    section_positions.append((match.start(), section_name))
-                    break  # Use first match for this section
-
-        # Sort by position
-        section_positions.sort(key=lambda x: x[0])
+        # Find all section headers (typically on their own line, possibly with decorations);
+        # finditer yields them in text order
+        seen_patterns = set()
+        for match in self._COMPILED_HEADER_RE.finditer(text):
+            group = match.lastgroup
+            if group in seen_patterns:
+                continue  # Use first match for each header pattern
+            seen_patterns.add(group)
+            section_positions.append((match.start(), group.partition("__")[0]))
 
         # Determine content boundaries
         for i, (start_pos, section_name) in enumerate(section_positions):
@@ -194,13 +284,13 @@ class CVSectionExtractor:
         experiences = []
 
         # Split into individual job entries (typically separated by blank lines)
-        entries = re.split(r"\n\s*\n", text)
+        entries = _ENTRY_SPLIT_RE.split(text)
 
         for entry in entries:
             if not entry.strip():
                 continue
 
-            lines = [l.strip() for l in entry.split("\n") if l.strip()]
+            lines = list(filter(None, map(str.strip, entry.splitlines())))
             if not lines:
                 continue
 
@@ -219,8 +309,7 @@ class CVSectionExtractor:
 
             # Try to extract position and company
             # Pattern: "Position at Company" or "Position | Company"
-            position_company_pattern = r"(.+?)\s+(?:at|@|\|)\s+(.+)"
-            match = re.search(position_company_pattern, first_line)
+            match = _POSITION_COMPANY_RE.search(first_line)
             if match:
                 exp["position"] = match.group(1).strip()
                 exp["company"] = match.group(2).strip()
@@ -228,30 +317,29 @@ class CVSectionExtractor:
                 exp["position"] = first_line
 
             # Look for dates (various formats)
-            date_pattern = r"(\d{4}|\w+\s+\d{4})\s*[-–—]\s*(\d{4}|\w+\s+\d{4}|Present|Current)"
             for line in lines:
-                date_match = re.search(date_pattern, line, re.IGNORECASE)
+                date_match = _search_date(_DATE_RE, line)
                 if date_match:
                     exp["startDate"] = date_match.group(1)
                     exp["endDate"] = (
                         None
-                        if date_match.group(2).lower() in ["present", "current"]
+                        if date_match.group(2).lower() in _OPEN_ENDED
                         else date_match.group(2)
                     )
                     break
 
             # Collect bullet points (achievements/responsibilities)
-            bullet_pattern = r"^[\s]*[•\-\*]\s*(.+)"
+            description_parts = []
             for line in lines[1:]:
-                bullet_match = re.match(bullet_pattern, line)
-                if bullet_match:
-                    exp["highlights"].append(bullet_match.group(1).strip())
-                elif not re.search(date_pattern, line):
+                bullet = _strip_bullet(line)
+                if bullet is not None:
+                    exp["highlights"].append(bullet)
+                elif not _search_date(_DATE_RE, line):
                     # Non-bullet descriptive text
-                    if exp["description"]:
-                        exp["description"] += " " + line
-                    else:
-                        exp["description"] = line
+                    description_parts.append(line)
+
+            if description_parts:
+                exp["description"] = " ".join(description_parts)
 
             experiences.append(exp)
 
@@ -261,13 +349,13 @@ class CVSectionExtractor:
         """Parse education entries"""
         education = []
 
-        entries = re.split(r"\n\s*\n", text)
+        entries = _ENTRY_SPLIT_RE.split(text)
 
         for entry in entries:
             if not entry.strip():
                 continue
 
-            lines = [l.strip() for l in entry.split("\n") if l.strip()]
+            lines = list(filter(None, map(str.strip, entry.splitlines())))
             if not lines:
                 continue
 
@@ -284,29 +372,21 @@ class CVSectionExtractor:
             # First line typically contains degree or institution
             edu["institution"] = lines[0]
 
-            # Look for degree information
-            degree_pattern = r"(Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Doctor)"
+            # Look for degree information, dates and GPA (first line with each)
             for line in lines:
-                degree_match = re.search(degree_pattern, line, re.IGNORECASE)
-                if degree_match:
-                    edu["degree"] = line
-                    break
-
-            # Look for dates
-            date_pattern = r"(\d{4})\s*[-–—]\s*(\d{4}|Present|Expected)"
-            for line in lines:
-                date_match = re.search(date_pattern, line, re.IGNORECASE)
-                if date_match:
-                    edu["startDate"] = date_match.group(1)
-                    edu["endDate"] = date_match.group(2)
-                    break
-
-            # Look for GPA
-            gpa_pattern = r"GPA:?\s*(\d+\.\d+)"
-            for line in lines:
-                gpa_match = re.search(gpa_pattern, line, re.IGNORECASE)
-                if gpa_match:
-                    edu["gpa"] = gpa_match.group(1)
+                for match in _EDU_MULTI_RE.finditer(line):
+                    kind = match.lastgroup
+                    if kind == "degree":
+                        if edu["degree"] is None:
+                            edu["degree"] = line
+                    elif kind == "date":
+                        if edu["startDate"] is None:
+                            edu["startDate"] = match.group("start")
+                            edu["endDate"] = match.group("end")
+                    elif edu["gpa"] is None:
+                        edu["gpa"] = match.group("gpa_value")
+
+                if edu["degree"] and edu["startDate"] and edu["gpa"]:
                     break
 
             education.append(edu)
@@ -318,22 +398,21 @@ class CVSectionExtractor:
         skills = []
 
         # Look for categorized skills (e.g., "Programming: Python, Java")
-        category_pattern = r"([^:\n]+):\s*([^\n]+)"
-        matches = re.finditer(category_pattern, text)
+        matches = _SKILL_CATEGORY_RE.finditer(text)
 
         for match in matches:
             category = match.group(1).strip()
             skills_text = match.group(2).strip()
 
             # Split skills by common delimiters
-            skill_items = re.split(r"[,;•|]", skills_text)
+            skill_items = skills_text.translate(_SKILL_DELIM_TABLE).split("|")
             skill_items = [s.strip() for s in skill_items if s.strip()]
 
             skills.append({"category": category, "items": skill_items})
 
         # If no categorized skills found, extract flat list
         if not skills:
-            items = re.split(r"[,;•|\n]", text)
+            items = text.translate(_SKILL_DELIM_TABLE).split("|")
             items = [s.strip() for s in items if s.strip()]
             if items:
                 skills.append({"category": "General", "items": items})
@@ -344,13 +423,13 @@ class CVSectionExtractor:
         """Parse project entries"""
         projects = []
 
-        entries = re.split(r"\n\s*\n", text)
+        entries = _ENTRY_SPLIT_RE.split(text)
 
         for entry in entries:
             if not entry.strip():
                 continue
 
-            lines = [l.strip() for l in entry.split("\n") if l.strip()]
+            lines = list(filter(None, map(str.strip, entry.splitlines())))
             if not lines:
                 continue
 
@@ -363,22 +442,21 @@ class CVSectionExtractor:
             }
 
             # Extract URL if present
-            url_pattern = r"https?://[\w.-]+(?:/[\w.-]*)*"
-            url_match = re.search(url_pattern, entry)
+            url_match = _URL_RE.search(entry)
             if url_match:
                 project["url"] = url_match.group(0)
 
             # Collect description and highlights
-            bullet_pattern = r"^[\s]*[•\-\*]\s*(.+)"
+            description_parts = []
             for line in lines[1:]:
-                bullet_match = re.match(bullet_pattern, line)
-                if bullet_match:
-                    project["highlights"].append(bullet_match.group(1).strip())
+                bullet = _strip_bullet(line)
+                if bullet is not None:
+                    project["highlights"].append(bullet)
                 elif not url_match or url_match.group(0) not in line:
-                    if project["description"]:
-                        project["description"] += " " + line
-                    else:
-                        project["description"] = line
+                    description_parts.append(line)
+
+            if description_parts:
+                project["description"] = " ".join(description_parts)
 
             projects.append(project)
 
@@ -389,23 +467,23 @@ class CVSectionExtractor:
         certifications = []
 
         # Certifications are often one per line or separated by bullets
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
+        lines = list(filter(None, map(str.strip, text.splitlines())))
 
         for line in lines:
             # Remove bullet points
-            line = re.sub(r"^[•\-\*]\s*", "", line)
+            if line[:1] in _BULLET_CHARS:
+                line = line[1:].lstrip()
 
             cert = {"name": line, "issuer": None, "date": None, "credential": None}
 
             # Try to extract issuer (often after hyphen or comma)
-            parts = re.split(r"\s+[-–—,]\s+", line)
+            parts = _ISSUER_SPLIT_RE.split(line)
             if len(parts) >= 2:
                 cert["name"] = parts[0]
                 cert["issuer"] = parts[1]
 
             # Look for dates
-            date_pattern = r"(\w+\s+\d{4}|\d{4})"
-            date_match = re.search(date_pattern, line)
+            date_match = _search_date(_CERT_DATE_RE, line)
             if date_match:
                 cert["date"] = date_match.group(1)
 
@@ -3,17 +3,33 @@ PDF Parser MCP Tool
 Extracts text and structured data from PDF CVs
 """
 
-import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, List, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+import copy
+import hashlib
+import io
 import logging
 
 import pdfplumber
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 from .extractor import CVSectionExtractor
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of pages OCR'd in parallel (Tesseract runs outside the GIL)
+OCR_WORKERS = 4
+# Render resolution for OCR; enough for the crisp text typical of CVs
+OCR_RESOLUTION = 200
+# Maximum number of parsed files kept in the result cache
+RESULT_CACHE_SIZE = 128
+
 
 class PDFParserTool:
     """MCP tool for parsing PDF CVs"""
@@ -24,6 +40,11 @@ class PDFParserTool:
         self.section_extractor = CVSectionExtractor()
         self.storage_backend = storage_backend  # Optional storage backend for remote files
 
+        # Parsed data per (path, size, mtime, options), or per (URI, content
+        # hash, options) for remote files; a rewritten file gets a new key,
+        # so stale entries just age out
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
     def execute(
         self,
         file_path: str,
@@ -46,16 +67,35 @@ class PDFParserTool:
         try:
             logger.info(f"Starting PDF parsing: {file_path}")
 
-            # Handle GCS URIs
+            # Handle GCS URIs; remote files are parsed from memory
+            source: Union[str, bytes] = file_path
             if file_path.startswith("gs://"):
-                file_path = self._download_from_gcs(file_path)
+                source = self._download_from_gcs(file_path)
 
-            # Validate file exists
-            if not Path(file_path).exists():
-                raise FileNotFoundError(f"PDF file not found: {file_path}")
+            if isinstance(source, bytes):
+                cache_key = (
+                    file_path, hashlib.sha256(source).hexdigest(),
+                    extract_images, ocr_enabled, language,
+                )
+            else:
+                # Validate file exists
+                path = Path(source)
+                if not path.exists():
+                    raise FileNotFoundError(f"PDF file not found: {source}")
+
+                st = path.stat()
+                cache_key = (
+                    str(path.resolve()), st.st_size, st.st_mtime_ns,
+                    extract_images, ocr_enabled, language,
+                )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                logger.info(f"Using cached parse result: {file_path}")
+                return {"parsed_data": copy.deepcopy(cached), "success": True, "error": None}
 
             # Extract text from PDF
-            text, metadata = self._extract_text(file_path, ocr_enabled, language)
+            text, metadata = self._extract_text(source, ocr_enabled, language)
 
             # Extract structured sections
             sections = self.section_extractor.extract_sections(text)
@@ -68,6 +108,11 @@ class PDFParserTool:
 
             logger.info(f"Successfully parsed PDF: {file_path}")
 
+            # Cache a private copy so callers can't mutate the cached result
+            self._result_cache[cache_key] = copy.deepcopy(parsed_data)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
             return {"parsed_data": parsed_data, "success": True, "error": None}
 
         except FileNotFoundError as e:
@@ -83,27 +128,44 @@ class PDFParserTool:
             }
 
     def _extract_text(
-        self, file_path: str, ocr_enabled: bool, language: str
+        self, source: Union[str, bytes], ocr_enabled: bool, language: str
     ) -> tuple[str, Dict[str, Any]]:
         """
-        Extract text from PDF using pdfplumber
+        Extract text from PDF
+
+        Uses PDFium's native text extraction when OCR isn't needed, and
+        pdfplumber otherwise or if PDFium fails on the file.
 
         Args:
-            file_path: Local path to PDF
+            source: Local path to PDF, or the PDF's contents
             ocr_enabled: Whether to use OCR
             language: OCR language
 
         Returns:
             Tuple of (extracted_text, metadata)
         """
-        text_content = []
+        if pdfium is not None and not ocr_enabled:
+            try:
+                return self._extract_text_pdfium(source)
+            except Exception as e:
+                logger.warning(f"PDFium extraction failed, using pdfplumber: {e}")
+
+        # Page text, or a pending OCR result for pages without a text layer
+        page_results: List[Union[str, Future]] = []
         metadata = {}
 
-        with pdfplumber.open(file_path) as pdf:
+        if isinstance(source, bytes):
+            pdf_file, file_size = io.BytesIO(source), len(source)
+        else:
+            pdf_file, file_size = source, Path(source).stat().st_size
+
+        with pdfplumber.open(pdf_file) as pdf, ThreadPoolExecutor(max_workers=OCR_WORKERS) as executor:
             metadata["num_pages"] = len(pdf.pages)
-            metadata["file_size_bytes"] = Path(file_path).stat().st_size
+            metadata["file_size_bytes"] = file_size
             metadata["extraction_method"] = "pdfplumber"
 
+            # Pages share one open document, so parsing and rendering stay
+            # sequential; only Tesseract runs in the pool
             for page_num, page in enumerate(pdf.pages, 1):
                 try:
                     # Try standard text extraction first
@@ -112,25 +174,90 @@ class PDFParserTool:
                     if not page_text and ocr_enabled:
                         # Fall back to OCR if no text found
                         logger.info(f"Using OCR for page {page_num}")
-                        page_text = self._ocr_page(page, language)
+                        image = self._render_page(page)
+                        page_results.append(executor.submit(self._ocr_image, image, language))
                         metadata["extraction_method"] = "ocr"
-
-                    if page_text:
-                        text_content.append(page_text)
+                    elif page_text:
+                        page_results.append(page_text)
 
                 except Exception as e:
                     logger.warning(f"Error extracting page {page_num}: {e}")
                     continue
 
-        full_text = "\n\n".join(text_content)
-        return full_text, metadata
+                finally:
+                    # pdf.pages keeps every page alive until the document closes;
+                    # drop its cached chars/layout objects now that it's done
+                    page.close()
+
+            # Write pages straight into one buffer as they resolve
+            buf = io.StringIO()
+            for result in page_results:
+                page_text = result.result() if isinstance(result, Future) else result
+                if page_text:
+                    if buf.tell():
+                        buf.write("\n\n")
+                    buf.write(page_text)
 
-    def _ocr_page(self, page, language: str) -> str:
+        return buf.getvalue(), metadata
+
+    def _extract_text_pdfium(self, source: Union[str, bytes]) -> tuple[str, Dict[str, Any]]:
         """
-        Perform OCR on a PDF page
+        Extract text from PDF using pypdfium2
+
+        Args:
+            source: Local path to PDF, or the PDF's contents
+
+        Returns:
+            Tuple of (extracted_text, metadata)
+        """
+        buf = io.StringIO()
+        pdf = pdfium.PdfDocument(source)
+        try:
+            metadata = {
+                "num_pages": len(pdf),
+                "file_size_bytes": (
+                    len(source) if isinstance(source, bytes) else Path(source).stat().st_size
+                ),
+                "extraction_method": "pdfium",
+            }
+
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    page_text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+
+                if page_text:
+                    if buf.tell():
+                        buf.write("\n\n")
+                    # PDFium ends lines with CRLF; match pdfplumber's output
+                    buf.write(page_text.replace("\r\n", "\n"))
+        finally:
+            pdf.close()
+
+        return buf.getvalue(), metadata
+
+    def _render_page(self, page):
+        """
+        Render a PDF page to a grayscale image for OCR
 
         Args:
             page: pdfplumber page object
+
+        Returns:
+            PIL image of the page
+        """
+        img = page.to_image(resolution=OCR_RESOLUTION)
+        return img.original.convert("L")
+
+    def _ocr_image(self, image, language: str) -> str:
+        """
+        Perform OCR on a rendered page image
+
+        Args:
+            image: PIL image of the page
             language: OCR language code
 
         Returns:
@@ -138,14 +265,9 @@ class PDFParserTool:
         """
         try:
             import pytesseract
-            from PIL import Image
-
-            # Convert page to image
-            img = page.to_image(resolution=300)
-            pil_image = img.original
 
             # Perform OCR
-            text = pytesseract.image_to_string(pil_image, lang=language)
+            text = pytesseract.image_to_string(image, lang=language)
             return text
 
         except ImportError:
@@ -155,15 +277,15 @@ class PDFParserTool:
             logger.error(f"OCR failed: {e}")
             return ""
 
-    def _download_from_gcs(self, gcs_uri: str) -> str:
+    def _download_from_gcs(self, gcs_uri: str) -> Union[str, bytes]:
         """
-        Download file from remote storage
+        Download file from remote storage into memory
 
         Args:
             gcs_uri: Storage URI (gs://bucket/path or file://path)
 
         Returns:
-            Local file path
+            File contents, or the local file path for file:// URIs
         """
         try:
             if not self.storage_backend:
@@ -179,199 +301,12 @@ class PDFParserTool:
                 # Assume it's a remote path
                 remote_path = gcs_uri
 
-            # Download to temporary location
-            local_path = f"/tmp/{Path(remote_path).name}"
-            self.storage_backend.download_file(remote_path, local_path)
+            # Read straight into memory; no temp file to write, re-read and clean up
+            data = self.storage_backend.download_bytes(remote_path)
 
-            logger.info(f"Downloaded from storage: {gcs_uri} -> {local_path}")
-            return local_path
+            logger.info(f"Downloaded from storage: {gcs_uri} ({len(data)} bytes)")
+            return data
 
         except Exception as e:
             logger.error(f"Storage download failed: {e}")
             raise
-
-
-class CVSectionExtractor:
-    """Extract structured sections from CV text"""
-
-    # Common section headers (case-insensitive patterns)
-    SECTION_PATTERNS = {
-        "contact": [
-            r"contact\s*(information)?",
-            r"personal\s*(information|details)",
-        ],
-        "summary": [r"summary", r"profile", r"objective", r"about\s*me"],
-        "experience": [
-            r"(work\s*)?experience",
-            r"employment\s*(history)?",
-            r"professional\s*experience",
-        ],
-        "education": [r"education", r"academic\s*(background)?", r"qualifications"],
-        "skills": [
-            r"skills",
-            r"technical\s*skills",
-            r"competencies",
-            r"expertise",
-        ],
-        "projects": [r"projects", r"portfolio"],
-        "certifications": [
-            r"certifications?",
-            r"certificates?",
-            r"licenses?",
-        ],
-        "languages": [r"languages?"],
-        "interests": [r"interests?", r"hobbies"],
-    }
-
-    def extract_sections(self, text: str) -> Dict[str, Any]:
-        """
-        Extract CV sections from text
-
-        Args:
-            text: Full CV text
-
-        Returns:
-            Dictionary of extracted sections
-        """
-        sections = {}
-
-        # Extract contact information
-        sections["contact"] = self._extract_contact(text)
-
-        # Extract other sections by pattern matching
-        section_boundaries = self._find_section_boundaries(text)
-
-        for section_name, (start, end) in section_boundaries.items():
-            section_text = text[start:end].strip()
-            sections[section_name] = self._parse_section_content(
-                section_name, section_text
-            )
-
-        return sections
-
-    def _extract_contact(self, text: str) -> Dict[str, Optional[str]]:
-        """
-        Extract contact information from CV text
-
-        Args:
-            text: CV text
-
-        Returns:
-            Dictionary with contact fields
-        """
-        contact = {
-            "email": None,
-            "phone": None,
-            "linkedin": None,
-            "github": None,
-            "website": None,
-            "location": None,
-        }
-
-        # Email pattern
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        email_match = re.search(email_pattern, text)
-        if email_match:
-            contact["email"] = email_match.group(0)
-
-        # Phone pattern (various formats)
-        phone_pattern = r"(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}"
-        phone_match = re.search(phone_pattern, text)
-        if phone_match:
-            contact["phone"] = phone_match.group(0)
-
-        # LinkedIn URL
-        linkedin_pattern = r"linkedin\.com/in/[\w-]+"
-        linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
-        if linkedin_match:
-            contact["linkedin"] = f"https://{linkedin_match.group(0)}"
-
-        # GitHub URL
-        github_pattern = r"github\.com/[\w-]+"
-        github_match = re.search(github_pattern, text, re.IGNORECASE)
-        if github_match:
-            contact["github"] = f"https://{github_match.group(0)}"
-
-        # Website URL
-        website_pattern = r"https?://(?:www\.)?[\w.-]+\.[a-z]{2,}"
-        website_matches = re.findall(website_pattern, text, re.IGNORECASE)
-        if website_matches:
-            # Filter out LinkedIn/GitHub URLs
-            for url in website_matches:
-                if "linkedin" not in url.lower() and "github" not in url.lower():
-                    contact["website"] = url
-                    break
-
-        return contact
-
-    def _find_section_boundaries(self, text: str) -> Dict[str, tuple[int, int]]:
-        """
-        Find start and end positions of each section
-
-        Args:
-            text: CV text
-
-        Returns:
-            Dictionary mapping section names to (start, end) positions
-        """
-        boundaries = {}
-        section_positions = []
-
-        # Find all section headers
-        for section_name, patterns in self.SECTION_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.finditer(
-                    rf"^\s*{pattern}\s*$", text, re.MULTILINE | re.IGNORECASE
-                )
-                for match in matches:
-                    section_positions.append(
-                        (match.start(), section_name, match.group(0))
-                    )
-
-        # Sort by position
-        section_positions.sort(key=lambda x: x[0])
-
-        # Determine boundaries
-        for i, (start_pos, section_name, header) in enumerate(section_positions):
-            # Section starts after the header line
-            content_start = start_pos + len(header)
-
-            # Section ends at the next section header or end of text
-            if i + 1 < len(section_positions):
-                content_end = section_positions[i + 1][0]
-            else:
-                content_end = len(text)
-
-            boundaries[section_name] = (content_start, content_end)
-
-        return boundaries
-
-    def _parse_section_content(
-        self, section_name: str, section_text: str
-    ) -> Any:
-        """
-        Parse section content based on section type
-
-        Args:
-            section_name: Name of the section
-            section_text: Section text content
-
-        Returns:
-            Parsed section data (structure depends on section type)
-        """
-        # For now, return as list of paragraphs
-        # In production, this would have specific parsers for each section type
-        paragraphs = [p.strip() for p in section_text.split("\n\n") if p.strip()]
-
-        if section_name in ["experience", "education", "projects", "certifications"]:
-            return paragraphs  # List of entries
-        elif section_name == "skills":
-            # Try to extract individual skills
-            skills = []
-            for para in paragraphs:
-                # Split by common delimiters
-                items = re.split(r"[,;•|]", para)
-                skills.extend([s.strip() for s in items if s.strip()])
-            return skills
-        else:
-            return "\n\n".join(paragraphs)  # Single text block
@@ -94,24 +94,19 @@ class TestPDFParserTool:
         assert "not found" in result["error"].lower()
         assert result["parsed_data"] is None
 
-    @patch("main.storage.Client")
-    def test_download_from_gcs(self, mock_storage, parser_tool, tmp_path):
+    def test_download_from_gcs(self, parser_tool):
         """Test downloading file from GCS"""
-        # Mock GCS client
-        mock_blob = Mock()
-        mock_bucket = Mock()
-        mock_bucket.blob.return_value = mock_blob
-        mock_client = Mock()
-        mock_client.bucket.return_value = mock_bucket
-        mock_storage.return_value = mock_client
+        # Mock storage backend
+        mock_backend = Mock()
+        mock_backend.download_bytes.return_value = b"%PDF-1.4"
+        parser_tool.storage_backend = mock_backend
 
         gcs_uri = "gs://test-bucket/path/to/cv.pdf"
-        local_path = parser_tool._download_from_gcs(gcs_uri)
+        data = parser_tool._download_from_gcs(gcs_uri)
 
-        assert local_path == "/tmp/cv.pdf"
-        mock_client.bucket.assert_called_once_with("test-bucket")
-        mock_bucket.blob.assert_called_once_with("path/to/cv.pdf")
-        mock_blob.download_to_filename.assert_called_once()
+        assert data == b"%PDF-1.4"
+        mock_backend.download_bytes.assert_called_once_with("path/to/cv.pdf")
+        mock_backend.download_file.assert_not_called()
 
 
 class TestCVSectionExtractor:
@@ -137,6 +132,23 @@ class TestCVSectionExtractor:
         assert contact["phone"] is not None
         assert "555" in contact["phone"]
 
+    @pytest.mark.parametrize("phone", [
+        "+1 (555) 123-4567",
+        "+44 20 7946 0958",
+        "1-800-555-1234",
+        "1 (555) 123-4567",
+        "1.800.555.1234",
+        "44 20 7946 0958",
+        "(555) 123-4567",
+        "555-123-4567",
+        "5551234567",
+    ])
+    def test_extract_contact_phone_formats(self, extractor, phone):
+        """Test phone extraction keeps country and area codes"""
+        contact = extractor._extract_contact(f"John Doe\nPhone: {phone}")
+
+        assert contact["phone"] == phone
+
     def test_extract_contact_linkedin(self, extractor):
         """Test LinkedIn extraction"""
         text = "linkedin.com/in/johndoe"
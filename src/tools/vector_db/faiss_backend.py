@@ -4,60 +4,161 @@ For local development with embeddings
 """
 
 from typing import Dict, Any, List, Optional
+from collections import OrderedDict
 from pathlib import Path
 import logging
-import json
+import os
 import pickle
+import struct
 
 import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Texts per transformer forward pass when embedding documents
+EMBED_BATCH_SIZE = 64
+
+# Index types: exact flat scan, HNSW graph, or flat until the corpus is
+# large enough for HNSW to pay off ("auto": HNSW, "hnsw_sq": HNSW over
+# 8-bit scalar-quantized vectors, trained on the corpus at that point)
+INDEX_TYPES = ("flat", "hnsw", "auto", "hnsw_sq")
+# Index each deferred type is rebuilt as
+_UPGRADE_TYPES = {"auto": "hnsw", "hnsw_sq": "hnsw_sq"}
+# HNSW graph degree and build/search beam widths
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+# Vector count at which a deferred index is rebuilt (and trained)
+HNSW_MIN_VECTORS = 1000
+
+# Maximum number of distinct queries kept in the query embedding cache
+QUERY_CACHE_SIZE = 4096
+
+# Encoder runtimes SentenceTransformer can load a model with
+ENCODER_BACKENDS = ("torch", "onnx")
+
+# Log records (store batches/deletes) between full index + metadata saves
+CHECKPOINT_INTERVAL = 100
+# Log record prefix: header JSON length, vector bytes length
+_RECORD_HEADER = struct.Struct("<II")
+# Share of index vectors orphaned by deletes/updates that triggers a compaction
+COMPACT_RATIO = 0.1
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize metadata or a log header to compact JSON"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON written by _dumps (or the older indented format)"""
+    return orjson.loads(data)
+
 
 class FAISSBackend:
     """FAISS-based vector database for local use"""
 
-    def __init__(self, index_path: str, embedding_model: str):
+    def __init__(
+        self,
+        index_path: str,
+        embedding_model: str,
+        index_type: str = "auto",
+        encoder_backend: str = "torch",
+        encoder_file: Optional[str] = None
+    ):
         """
         Initialize FAISS backend
 
         Args:
             index_path: Path to store index and metadata
             embedding_model: Sentence transformers model name
+            index_type: 'flat' (exact), 'hnsw' (approximate), 'auto'
+                (flat, rebuilt as HNSW once it holds HNSW_MIN_VECTORS), or
+                'hnsw_sq' (like 'auto', but quantizes vectors to 8 bits)
+            encoder_backend: 'torch' or 'onnx' (ONNX Runtime; exports the
+                model on first use if the repo has no ONNX file)
+            encoder_file: ONNX file within the model repo, e.g.
+                'onnx/model_qint8_avx512_vnni.onnx' for an int8 model
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type}")
+        if encoder_backend not in ENCODER_BACKENDS:
+            raise ValueError(f"Unknown encoder backend: {encoder_backend}")
+        self.index_type = index_type
+        self.encoder_backend = encoder_backend
+
         self.index_path = Path(index_path)
         self.index_path.mkdir(parents=True, exist_ok=True)
 
-        self.index_file = self.index_path / "faiss.index"
         self.metadata_file = self.index_path / "metadata.json"
+        # Write-ahead log of changes since the last checkpoint
+        self.log_file = self.index_path / "pending.log"
 
         # Load embedding model
-        logger.info(f"Loading embedding model: {embedding_model}")
-        self.model = SentenceTransformer(embedding_model)
+        logger.info(f"Loading embedding model: {embedding_model} ({encoder_backend})")
+        if encoder_backend == "torch":
+            self.model = SentenceTransformer(embedding_model)
+        else:
+            self.model = SentenceTransformer(
+                embedding_model,
+                backend=encoder_backend,
+                model_kwargs={"file_name": encoder_file} if encoder_file else None
+            )
         self.dimension = self.model.get_sentence_embedding_dimension()
 
-        # Load or create index
-        if self.index_file.exists():
-            self.index = faiss.read_index(str(self.index_file))
-            logger.info(f"Loaded FAISS index from: {self.index_file}")
-        else:
-            # Create new index (using cosine similarity)
-            self.index = faiss.IndexFlatIP(self.dimension)
-            logger.info(f"Created new FAISS index with dimension: {self.dimension}")
+        # One throwaway encode pulls in the tokenizer and lazily initialized
+        # kernels (or builds the ONNX session), so the first real search
+        # doesn't pay for it
+        self.model.encode(["warmup"], normalize_embeddings=True)
+
+        # Query text -> (1, dimension) float32 embedding, so repeated
+        # searches skip the forward pass
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
         # Load or create metadata
         if self.metadata_file.exists():
-            with open(self.metadata_file, "r") as f:
-                self.metadata = json.load(f)
+            self.metadata = _loads(self.metadata_file.read_bytes())
         else:
             self.metadata = {
                 "documents": {},  # document_id -> {metadata, index_position}
                 "id_to_position": {},  # document_id -> index position
-                "position_to_id": {}  # index position -> document_id
             }
 
+        # Checkpoint the metadata belongs to, which names its index file
+        self._generation = self.metadata.pop("generation", 0)
+        self.index_file = self._index_file_for(self._generation)
+
+        # Load or create index
+        if self.index_file.exists():
+            self.index = faiss.read_index(str(self.index_file))
+            if hasattr(self.index, "hnsw"):
+                # Search-time parameter, not guaranteed to round-trip
+                self.index.hnsw.efSearch = HNSW_EF_SEARCH
+            logger.info(f"Loaded FAISS index from: {self.index_file}")
+        else:
+            # Create new index (using cosine similarity)
+            self.index = self._create_index(
+                "flat" if index_type in _UPGRADE_TYPES else index_type
+            )
+            logger.info(f"Created new FAISS index with dimension: {self.dimension}")
+
+        # Index position -> document_id, derived rather than persisted
+        # (files written before this change still carry a copy; drop it)
+        self.metadata.pop("position_to_id", None)
+        self._pos_to_id: Dict[int, str] = {
+            position: document_id
+            for document_id, position in self.metadata["id_to_position"].items()
+        }
+
+        # Apply changes logged after the last checkpoint, then fold them in
+        self._pending = self._replay_log()
+        self._log = open(self.log_file, "ab")
+        if self._pending:
+            self.flush()
+
     def store(self, text: str, document_id: str, metadata: Dict[str, Any]) -> None:
         """
         Store document embedding
@@ -67,32 +168,104 @@ class FAISSBackend:
             document_id: Unique document identifier
             metadata: Document metadata
         """
-        # Generate embedding
-        embedding = self.model.encode([text], normalize_embeddings=True)[0]
+        self.store_batch([text], [document_id], [metadata])
 
-        # Check if document already exists
-        if document_id in self.metadata["documents"]:
-            logger.warning(f"Document {document_id} already exists, updating...")
-            # For simplicity, we'll delete and re-add
-            self.delete(document_id)
+    def store_batch(
+        self,
+        texts: List[str],
+        document_ids: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Store several document embeddings at once
 
-        # Add to index
-        position = self.index.ntotal
-        self.index.add(np.array([embedding], dtype=np.float32))
+        Embeds all texts in batched forward passes, appends them to the
+        index in one call and writes a single log record.
 
-        # Store metadata
-        self.metadata["documents"][document_id] = {
-            "metadata": metadata,
-            "text_preview": text[:200],  # Store preview for debugging
-            "position": position
-        }
-        self.metadata["id_to_position"][document_id] = position
-        self.metadata["position_to_id"][str(position)] = document_id
+        Args:
+            texts: Texts to embed
+            document_ids: Unique document identifiers, one per text
+            metadatas: Document metadata, one per text (optional)
+        """
+        if metadatas is None:
+            metadatas = [{} for _ in texts]
+        if not len(texts) == len(document_ids) == len(metadatas):
+            raise ValueError("texts, document_ids and metadatas must have the same length")
+        if not texts:
+            return
 
-        # Save to disk
-        self._save()
+        # Generate embeddings
+        embeddings = self.model.encode(
+            texts,
+            batch_size=EMBED_BATCH_SIZE,
+            normalize_embeddings=False,
+            convert_to_numpy=True
+        )
+
+        # L2-normalize the whole matrix in place, in one vectorized pass
+        # rather than per encoder batch (same epsilon as the encoder's)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, np.maximum(norms, 1e-12), out=embeddings)
+        start = self.index.ntotal
+        previews = [text[:200] for text in texts]  # Store preview for debugging
+
+        self._apply_store(start, embeddings, document_ids, metadatas, previews)
+        self._append_log(
+            {
+                "op": "store",
+                "start": start,
+                "ids": document_ids,
+                "metadatas": metadatas,
+                "previews": previews,
+            },
+            embeddings.tobytes()
+        )
 
-        logger.info(f"Stored document: {document_id} at position {position}")
+        if len(texts) == 1:
+            logger.info(f"Stored document: {document_ids[0]} at position {start}")
+        else:
+            logger.info(f"Stored {len(texts)} documents at positions {start}-{start + len(texts) - 1}")
+
+        # Updates orphan the document's previous vector
+        self._maybe_compact()
+
+    def _apply_store(
+        self,
+        start: int,
+        embeddings: np.ndarray,
+        document_ids: List[str],
+        metadatas: List[Dict[str, Any]],
+        previews: List[str]
+    ) -> None:
+        """
+        Add embeddings at index positions start.. and record their documents
+
+        Vectors the index already holds (a replayed record that made it into
+        the last checkpoint) are skipped, so applying a record twice is safe.
+        """
+        skip = self.index.ntotal - start
+        if skip < 0:
+            raise ValueError(f"Index has {self.index.ntotal} vectors, cannot add at position {start}")
+        if skip < len(embeddings):
+            self.index.add(embeddings[skip:])
+            self._maybe_upgrade_index()
+
+        for position, document_id, metadata, preview in zip(
+            range(start, start + len(document_ids)), document_ids, metadatas, previews
+        ):
+            # Check if document already exists (or repeats within the batch)
+            if document_id in self.metadata["documents"]:
+                logger.warning(f"Document {document_id} already exists, updating...")
+                self._remove(document_id)
+
+            self.metadata["documents"][document_id] = {
+                "metadata": metadata,
+                "text_preview": preview,
+                "position": position
+            }
+            self.metadata["id_to_position"][document_id] = position
+            self._pos_to_id[position] = document_id
 
     def search(
         self,
@@ -116,24 +289,25 @@ class FAISSBackend:
             return []
 
         # Generate query embedding
-        query_embedding = self.model.encode([query], normalize_embeddings=True)[0]
+        query_embedding = self._encode_query(query)
 
-        # Search
+        # Search, over-fetching by the orphaned vectors so they can't
+        # crowd live documents out of the top k
         scores, indices = self.index.search(
-            np.array([query_embedding], dtype=np.float32),
-            min(top_k, self.index.ntotal)
+            query_embedding,
+            min(top_k + self._dead_vectors(), self.index.ntotal)
         )
 
         # Format results
         results = []
         for score, idx in zip(scores[0], indices[0]):
-            if score < score_threshold:
+            # HNSW pads with -1 when it finds fewer than top_k neighbours
+            if idx < 0 or score < score_threshold:
                 continue
 
-            # Get document ID from position
-            document_id = self.metadata["position_to_id"].get(str(idx))
+            # Get document ID from position (none for deleted documents)
+            document_id = self._pos_to_id.get(int(idx))
             if not document_id:
-                logger.warning(f"No document found for position {idx}")
                 continue
 
             doc_metadata = self.metadata["documents"][document_id]["metadata"]
@@ -143,10 +317,30 @@ class FAISSBackend:
                 "score": float(score),
                 "metadata": doc_metadata
             })
+            if len(results) == top_k:
+                break
 
         logger.info(f"Search returned {len(results)} results above threshold {score_threshold}")
         return results
 
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing the embedding for repeated queries"""
+        # Surrounding whitespace never reaches the model; case can, for cased models
+        key = query.strip()
+        embedding = self._query_cache.get(key)
+        if embedding is not None:
+            self._query_cache.move_to_end(key)
+            return embedding
+
+        embedding = np.ascontiguousarray(
+            self.model.encode([key], normalize_embeddings=True), dtype=np.float32
+        )
+        embedding.flags.writeable = False
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return embedding
+
     def delete(self, document_id: str) -> None:
         """
         Delete document from index
@@ -158,19 +352,104 @@ class FAISSBackend:
             logger.warning(f"Document {document_id} not found")
             return
 
-        # Note: FAISS doesn't support deletion, so we mark as deleted
-        # and rebuild index if too many deletions accumulate
-        position = self.metadata["documents"][document_id]["position"]
+        self._remove(document_id)
+        self._append_log({"op": "delete", "id": document_id})
 
-        del self.metadata["documents"][document_id]
-        del self.metadata["id_to_position"][document_id]
-        del self.metadata["position_to_id"][str(position)]
+        logger.info(f"Marked document {document_id} as deleted")
 
-        self._save()
+        self._maybe_compact()
 
-        logger.info(f"Marked document {document_id} as deleted")
+    def compact(self) -> None:
+        """
+        Rebuild the index without the vectors of deleted or replaced documents
+
+        Live vectors keep their relative order but move to new positions,
+        so the result is checkpointed straight away.
+        """
+        dead = self._dead_vectors()
+        if not dead:
+            return
+
+        live = sorted(self._pos_to_id)
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)[live]
+
+        # Deferred types start over as flat if the survivors are too few
+        index_type = self.index_type
+        if index_type in _UPGRADE_TYPES:
+            index_type = _UPGRADE_TYPES[index_type] if len(live) >= HNSW_MIN_VECTORS else "flat"
+        index = self._create_index(index_type)
+        if not index.is_trained:
+            index.train(vectors)
+        index.add(vectors)
+        self.index = index
+
+        pos_to_id = {}
+        for position, old_position in enumerate(live):
+            document_id = self._pos_to_id[old_position]
+            self.metadata["documents"][document_id]["position"] = position
+            self.metadata["id_to_position"][document_id] = position
+            pos_to_id[position] = document_id
+        self._pos_to_id = pos_to_id
+
+        # Logged records refer to the old positions; replace them with a checkpoint
+        self.flush()
+
+        logger.info(f"Compacted FAISS index: dropped {dead} vectors, {index.ntotal} remain")
+
+    def _dead_vectors(self) -> int:
+        """Number of index vectors no document points at any more"""
+        return self.index.ntotal - len(self._pos_to_id)
+
+    def _maybe_compact(self) -> None:
+        """Compact once orphaned vectors exceed COMPACT_RATIO of the index"""
+        if self._dead_vectors() > COMPACT_RATIO * self.index.ntotal:
+            self.compact()
+
+    def _create_index(self, index_type: str) -> faiss.Index:
+        """Create an empty inner-product index of the given type"""
+        if index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+            return index
+        if index_type == "hnsw_sq":
+            index = faiss.IndexHNSWSQ(
+                self.dimension, faiss.ScalarQuantizer.QT_8bit, HNSW_M,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+            return index
+        return faiss.IndexFlatIP(self.dimension)
+
+    def _maybe_upgrade_index(self) -> None:
+        """Rebuild a deferred flat index as its target type once it is large enough"""
+        target = _UPGRADE_TYPES.get(self.index_type)
+        if (
+            target is None
+            or not isinstance(self.index, faiss.IndexFlat)
+            or self.index.ntotal < HNSW_MIN_VECTORS
+        ):
+            return
+
+        # Re-adding in order keeps every vector at its current position
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        index = self._create_index(target)
+        if not index.is_trained:
+            # Quantizer ranges come from the corpus collected so far
+            index.train(vectors)
+        index.add(vectors)
+        self.index = index
+        logger.info(f"Rebuilt FAISS index as {type(index).__name__} with {index.ntotal} vectors")
+
+    def _remove(self, document_id: str) -> None:
+        """Drop a document from the metadata maps without saving"""
+        # FAISS can't delete from these indexes; the vector stays until compact()
+        position = self.metadata["documents"][document_id]["position"]
 
-        # TODO: Implement index rebuilding if needed
+        del self.metadata["documents"][document_id]
+        del self.metadata["id_to_position"][document_id]
+        del self._pos_to_id[position]
 
     def list_documents(self) -> List[Dict[str, Any]]:
         """
@@ -194,14 +473,112 @@ class FAISSBackend:
         return {
             "backend": "faiss",
             "dimension": self.dimension,
+            "index_type": type(self.index).__name__,
             "total_vectors": self.index.ntotal,
             "total_documents": len(self.metadata["documents"]),
+            "deleted_vectors": self._dead_vectors(),
+            "pending_writes": self._pending,
             "index_path": str(self.index_path),
+            "encoder_backend": self.encoder_backend,
             "embedding_model": self.model._model_card_data.model_id if hasattr(self.model, "_model_card_data") else "unknown"
         }
 
+    def flush(self) -> None:
+        """Checkpoint: save index and metadata, then truncate the log"""
+        self._save()
+        self._log.truncate(0)
+        self._pending = 0
+
+    def close(self) -> None:
+        """Checkpoint pending changes and close the log"""
+        if self._pending:
+            self.flush()
+        self._log.close()
+
+    def _append_log(self, header: Dict[str, Any], vectors: bytes = b"") -> None:
+        """Append a change record to the log, checkpointing every CHECKPOINT_INTERVAL"""
+        # Tag the record with the checkpoint it applies on top of
+        header_bytes = _dumps({**header, "gen": self._generation})
+        self._log.write(_RECORD_HEADER.pack(len(header_bytes), len(vectors)))
+        self._log.write(header_bytes)
+        self._log.write(vectors)
+        self._log.flush()
+
+        self._pending += 1
+        if self._pending >= CHECKPOINT_INTERVAL:
+            self.flush()
+
+    def _replay_log(self) -> int:
+        """
+        Apply log records left by a process that exited before checkpointing
+
+        Returns:
+            Number of records applied
+        """
+        if not self.log_file.exists():
+            return 0
+
+        data = self.log_file.read_bytes()
+        offset = 0
+        applied = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            header_len, vectors_len = _RECORD_HEADER.unpack_from(data, offset)
+            body = offset + _RECORD_HEADER.size
+            end = body + header_len + vectors_len
+            if end > len(data):
+                break
+
+            header = _loads(data[body:body + header_len])
+            if header.get("gen", 0) != self._generation:
+                # Written before the last checkpoint (the process stopped
+                # before truncating the log), so already part of it
+                pass
+            elif header["op"] == "store":
+                embeddings = np.frombuffer(
+                    data, dtype=np.float32, count=vectors_len // 4, offset=body + header_len
+                ).reshape(-1, self.dimension)
+                self._apply_store(
+                    header["start"], embeddings, header["ids"], header["metadatas"], header["previews"]
+                )
+            elif header["id"] in self.metadata["documents"]:
+                self._remove(header["id"])
+
+            offset = end
+            applied += 1
+
+        if offset < len(data):
+            # Torn write at the end of the log; the record never completed
+            logger.warning(f"Discarding {len(data) - offset} bytes of incomplete log record")
+            with open(self.log_file, "r+b") as f:
+                f.truncate(offset)
+
+        if applied:
+            logger.info(f"Replayed {applied} log records from: {self.log_file}")
+        return applied
+
+    def _index_file_for(self, generation: int) -> Path:
+        """Index file of a checkpoint generation"""
+        # Generation 0 is the unnumbered file written before checkpoints were numbered
+        if generation == 0:
+            return self.index_path / "faiss.index"
+        return self.index_path / f"faiss.{generation}.index"
+
     def _save(self) -> None:
-        """Save index and metadata to disk"""
-        faiss.write_index(self.index, str(self.index_file))
-        with open(self.metadata_file, "w") as f:
-            json.dump(self.metadata, f, indent=2)
+        """Save index and metadata to disk as the next checkpoint generation"""
+        # The index goes to a new file for the generation, then the metadata
+        # naming that generation replaces the old one in a single rename. A
+        # crash before the rename leaves the previous checkpoint (and the log
+        # on top of it) untouched; compaction renumbers positions, so the two
+        # files must never be mixed across checkpoints
+        generation = self._generation + 1
+        index_file = self._index_file_for(generation)
+        faiss.write_index(self.index, str(index_file))
+
+        tmp_metadata = self.metadata_file.with_suffix(".json.tmp")
+        tmp_metadata.write_bytes(_dumps({**self.metadata, "generation": generation}))
+        os.replace(tmp_metadata, self.metadata_file)
+
+        previous = self.index_file
+        self._generation = generation
+        self.index_file = index_file
+        previous.unlink(missing_ok=True)
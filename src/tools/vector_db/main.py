@@ -44,7 +44,10 @@ class VectorDBTool:
             from .faiss_backend import FAISSBackend
             self.backend = FAISSBackend(
                 index_path=str(self.index_path),
-                embedding_model=self.embedding_model
+                embedding_model=self.embedding_model,
+                index_type=kwargs.get("index_type", "auto"),
+                encoder_backend=kwargs.get("encoder_backend", "torch"),
+                encoder_file=kwargs.get("encoder_file")
             )
         elif backend_type == "vertex":
             from .vertex_backend import VertexBackend
@@ -66,18 +69,24 @@ class VectorDBTool:
         metadata: Optional[Dict[str, Any]] = None,
         top_k: int = 5,
         score_threshold: float = 0.7,
+        texts: Optional[List[str]] = None,
+        document_ids: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Execute vector DB operation
 
         Args:
-            operation: 'store', 'search', 'delete', or 'list'
+            operation: 'store', 'store_batch', 'search', 'delete', or 'list'
             text: Text to embed (for store/search)
             document_id: Document identifier (for store/delete)
             metadata: Metadata to store with embedding
             top_k: Number of results for search
             score_threshold: Minimum similarity score
+            texts: Texts to embed (for store_batch)
+            document_ids: Document identifiers, one per text (for store_batch)
+            metadatas: Metadata per text (for store_batch, optional)
 
         Returns:
             Dictionary with success, results, and optional error
@@ -99,6 +108,27 @@ class VectorDBTool:
                     "error": None
                 }
 
+            elif operation == "store_batch":
+                if not texts or not document_ids:
+                    raise ValueError("texts and document_ids required for store_batch operation")
+                if not hasattr(self.backend, "store_batch"):
+                    raise ValueError(f"store_batch is not supported by the {self.backend_type} backend")
+
+                self.backend.store_batch(
+                    texts=texts,
+                    document_ids=document_ids,
+                    metadatas=metadatas
+                )
+
+                return {
+                    "success": True,
+                    "results": [
+                        {"document_id": doc_id, "operation": "stored"}
+                        for doc_id in document_ids
+                    ],
+                    "error": None
+                }
+
             elif operation == "search":
                 if not text:
                     raise ValueError("text required for search operation")
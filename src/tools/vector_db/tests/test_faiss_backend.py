@@ -0,0 +1,160 @@
+"""
+Unit tests for the FAISS vector DB backend's log and checkpoints
+"""
+
+import hashlib
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("faiss")
+pytest.importorskip("sentence_transformers")
+
+import faiss_backend
+from faiss_backend import FAISSBackend
+
+DIMENSION = 16
+
+
+class FakeEncoder:
+    """Deterministic stand-in for SentenceTransformer"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_sentence_embedding_dimension(self):
+        return DIMENSION
+
+    def encode(self, texts, normalize_embeddings=False, **kwargs):
+        vectors = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.md5(text.encode()).digest()[:4], "little")
+            vector = np.random.default_rng(seed).standard_normal(DIMENSION).astype(np.float32)
+            vectors.append(vector / np.linalg.norm(vector) if normalize_embeddings else vector)
+        return np.stack(vectors)
+
+
+@pytest.fixture(autouse=True)
+def fake_encoder():
+    with patch.object(faiss_backend, "SentenceTransformer", FakeEncoder):
+        yield
+
+
+def open_backend(path):
+    return FAISSBackend(index_path=str(path), embedding_model="fake", index_type="flat")
+
+
+def snapshot(backend):
+    return backend.index.ntotal, backend.metadata
+
+
+class TestWriteAheadLog:
+    """Tests for log records written between checkpoints"""
+
+    def test_changes_are_appended_to_log(self, tmp_path):
+        backend = open_backend(tmp_path)
+        backend.store_batch(["a", "b"], ["a", "b"])
+        size = backend.log_file.stat().st_size
+
+        backend.store("c", "c", {})
+
+        assert size > 0
+        assert backend.log_file.stat().st_size > size
+        assert backend.get_stats()["pending_writes"] == 2
+        assert not backend.metadata_file.exists()
+
+    def test_replay_restores_unsaved_changes(self, tmp_path):
+        backend = open_backend(tmp_path)
+        backend.store_batch([f"doc {i}" for i in range(10)], [f"d{i}" for i in range(10)])
+        backend.store("doc 1 v2", "d1", {"version": 2})
+        expected = snapshot(backend)
+
+        # No close(): the process stopped before checkpointing
+        reopened = open_backend(tmp_path)
+
+        assert snapshot(reopened) == expected
+        assert reopened.search("doc 1 v2", top_k=1, score_threshold=0.0)[0]["document_id"] == "d1"
+        assert reopened.log_file.stat().st_size == 0
+
+    def test_torn_record_is_truncated(self, tmp_path):
+        backend = open_backend(tmp_path)
+        backend.store("a", "a", {"n": 1})
+        backend._log.close()
+        with open(backend.log_file, "ab") as f:
+            f.write(faiss_backend._RECORD_HEADER.pack(64, 0) + b'{"op":')
+
+        reopened = open_backend(tmp_path)
+
+        assert list(reopened.metadata["documents"]) == ["a"]
+        assert reopened.index.ntotal == 1
+
+    def test_checkpoint_interval(self, tmp_path):
+        with patch.object(faiss_backend, "CHECKPOINT_INTERVAL", 3):
+            backend = open_backend(tmp_path)
+            for i in range(7):
+                backend.store(f"t{i}", f"t{i}", {})
+
+        assert backend.get_stats()["pending_writes"] == 1
+        backend.close()
+        assert backend.log_file.stat().st_size == 0
+        assert open_backend(tmp_path).index.ntotal == 7
+
+
+class TestCheckpoints:
+    """Tests for saving index and metadata consistently"""
+
+    def test_compaction_renumbers_and_checkpoints(self, tmp_path):
+        backend = open_backend(tmp_path)
+        backend.store_batch([f"doc {i}" for i in range(5)], [f"d{i}" for i in range(5)])
+        backend.delete("d0")
+
+        assert backend.index.ntotal == 4
+        assert sorted(backend.metadata["id_to_position"].values()) == [0, 1, 2, 3]
+        assert snapshot(open_backend(tmp_path)) == snapshot(backend)
+
+    def test_log_from_before_checkpoint_is_not_replayed(self, tmp_path):
+        backend = open_backend(tmp_path)
+        backend.store_batch([f"doc {i}" for i in range(5)], [f"d{i}" for i in range(5)])
+        stale_log = backend.log_file.read_bytes()
+        backend.delete("d0")  # Compacts and checkpoints
+        expected = snapshot(backend)
+        backend._log.close()
+
+        # Stopped after the checkpoint but before the log was truncated
+        backend.log_file.write_bytes(stale_log)
+        reopened = open_backend(tmp_path)
+
+        assert snapshot(reopened) == expected
+
+    def test_interrupted_checkpoint_keeps_previous_one(self, tmp_path):
+        backend = open_backend(tmp_path)
+        backend.store_batch([f"doc {i}" for i in range(5)], [f"d{i}" for i in range(5)])
+        backend.flush()
+        backend.store("doc 5", "d5", {})
+
+        real_replace = os.replace
+
+        def replace(source, destination):
+            if Path(destination).name == "metadata.json":
+                raise OSError("crash")
+            real_replace(source, destination)
+
+        # Compaction wrote its index file, then failed before the metadata rename
+        with patch.object(faiss_backend.os, "replace", side_effect=replace):
+            with pytest.raises(OSError):
+                backend.delete("d0")
+        backend._log.close()
+
+        reopened = open_backend(tmp_path)
+
+        # Previous checkpoint plus the logged store and delete, uncompacted
+        assert reopened.index.ntotal == 6
+        assert sorted(reopened.metadata["documents"]) == ["d1", "d2", "d3", "d4", "d5"]
+        for i in range(1, 6):
+            assert reopened.search(f"doc {i}", top_k=1, score_threshold=0.0)[0]["document_id"] == f"d{i}"
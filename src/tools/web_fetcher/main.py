@@ -3,28 +3,188 @@ Web Fetcher MCP Tool
 Fetch and parse job advertisements from URLs
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+import asyncio
+import codecs
 import logging
+import re
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Connection pools per host kept by the session, and connections per pool
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 100
+# Retries for connection errors and throttled/unavailable responses
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Maximum URLs fetched at once by execute_many
+FETCH_CONCURRENCY = 16
+# Largest response body read; bigger pages are rejected, not parsed
+MAX_CONTENT_BYTES = 2 * 1024 * 1024
+# Chunk size for streaming response bodies
+STREAM_CHUNK_BYTES = 65536
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+# Bytes scanned for a meta charset (the HTML spec's prescan window)
+_CHARSET_PRESCAN_BYTES = 1024
+# Content types that are already text and skip HTML parsing (as do +json types)
+_TEXT_CONTENT_TYPES = ("text/plain", "application/json")
+
+
+def _decode_html(content: bytes, header_charset: Optional[str]) -> str:
+    """
+    Decode an HTML body the way a browser would pick its encoding
+
+    Order: byte order mark, Content-Type charset, <meta> charset in the
+    first 1 KB, then UTF-8 with a windows-1252 fallback.
+    """
+    if content.startswith(codecs.BOM_UTF8):
+        return content[len(codecs.BOM_UTF8):].decode("utf-8", errors="replace")
+
+    encoding = header_charset
+    if not encoding:
+        match = _META_CHARSET_RE.search(content, 0, _CHARSET_PRESCAN_BYTES)
+        if match:
+            encoding = match.group(1).decode("ascii")
+
+    if encoding:
+        try:
+            return content.decode(encoding, errors="replace")
+        except LookupError:
+            logger.warning(f"Unknown page encoding {encoding!r}, guessing")
+
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return content.decode("cp1252", errors="replace")
+
+
+def _html_to_text(response: requests.Response) -> str:
+    """Extract the text of an HTML page, without scripts and styles"""
+    if LexborHTMLParser is None:
+        soup = BeautifulSoup(response.content, "html.parser")
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        return soup.get_text()
+
+    # Lexbor reads bytes as UTF-8, so decode first; response.encoding is only
+    # trusted when the server actually sent a charset
+    content_type = response.headers.get("Content-Type", "")
+    header_charset = response.encoding if "charset" in content_type.lower() else None
+    tree = LexborHTMLParser(_decode_html(response.content, header_charset))
+
+    # Remove script and style elements
+    for node in tree.css("script, style"):
+        node.decompose()
+
+    return tree.root.text(deep=True, separator="", strip=False) if tree.root else ""
+
 
 class WebFetcherTool:
     """MCP tool for fetching web content"""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_bytes: int = MAX_CONTENT_BYTES):
         """
         Initialize web fetcher
 
         Args:
             timeout: Request timeout in seconds
+            max_bytes: Maximum response body size in bytes
         """
         self.name = "web_fetcher"
         self.version = "1.0.0"
         self.timeout = timeout
+        self.max_bytes = max_bytes
+
+        # Reused session, so repeat fetches from a host skip the TCP/TLS handshake
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False  # Let raise_for_status report the final response
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["User-Agent"] = "CV-Enhancer-Bot/1.0"
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+    def _read_body(self, response: requests.Response) -> None:
+        """
+        Read a streamed response body, giving up past max_bytes
+
+        Checks Content-Length before reading anything, then counts the
+        decoded bytes in case the header is missing or wrong.
+
+        Args:
+            response: Response opened with stream=True
+
+        Raises:
+            ValueError: If the body is larger than max_bytes
+        """
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise ValueError(
+                f"Response too large: {content_length} bytes (limit {self.max_bytes})"
+            )
+
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+            buf.extend(chunk)
+            if len(buf) > self.max_bytes:
+                raise ValueError(
+                    f"Response too large: over {self.max_bytes} bytes"
+                )
+
+        # Hand the body back to the response, so .content/.text work as usual
+        response._content = bytes(buf)
+
+    async def execute_many(
+        self, urls: List[str], extract_text_only: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several URLs concurrently
+
+        Each fetch runs execute() in a worker thread on the shared session,
+        at most FETCH_CONCURRENCY at a time.
+
+        Args:
+            urls: URLs to fetch
+            extract_text_only: If True, extract only text content
+
+        Returns:
+            One execute() result per URL, in input order
+        """
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def fetch(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self.execute, url, extract_text_only)
+
+        return await asyncio.gather(*(fetch(url) for url in urls))
 
     def execute(self, url: str, extract_text_only: bool = True) -> Dict[str, Any]:
         """
@@ -40,29 +200,25 @@ class WebFetcherTool:
         try:
             logger.info(f"Fetching URL: {url}")
 
-            # Fetch page
-            response = requests.get(
-                url,
-                timeout=self.timeout,
-                headers={"User-Agent": "CV-Enhancer-Bot/1.0"}
-            )
-            response.raise_for_status()
+            # Fetch page, streaming so oversized bodies are dropped early
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                self._read_body(response)
 
             if extract_text_only:
-                # Parse HTML and extract text
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-
-                # Get text
-                text = soup.get_text()
-
-                # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = "\n".join(chunk for chunk in chunks if chunk)
+                content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                if content_type in _TEXT_CONTENT_TYPES or content_type.endswith("+json"):
+                    # JSON APIs and plain text have no markup to strip, and
+                    # reflowing their whitespace could corrupt them
+                    text = response.text
+                else:
+                    # Parse HTML and extract text
+                    text = _html_to_text(response)
+
+                    # Clean up whitespace: line breaks and runs of 2+ spaces both end
+                    # a chunk, so join lines with "  " and split once
+                    chunks = map(str.strip, "  ".join(text.splitlines()).split("  "))
+                    text = "\n".join(filter(None, chunks))
 
                 return {
                     "success": True,
@@ -13,12 +13,6 @@ import sys
 import argparse
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from src.config import get_config, get_storage_backend, get_llm_provider, setup_logging
-from src.agents import OrchestratorAgent
-
 # Sample CV text for testing (if no PDF available)
 SAMPLE_CV_TEXT = """
 John Doe
@@ -84,37 +78,60 @@ Nice to Have:
 We offer competitive salary, remote work options, and comprehensive benefits.
 """
 
+# Sample files are written as raw bytes, so encode once at import
+_SAMPLE_CV_BYTES = SAMPLE_CV_TEXT.encode("utf-8")
+_SAMPLE_JOB_BYTES = SAMPLE_JOB_AD.encode("utf-8")
+
+
+class StepLogger:
+    """Collects a step's status lines and writes them out in one call"""
+
+    def __init__(self):
+        self.buf = []
+
+    def log(self, line: str = "") -> None:
+        self.buf.append(line)
+
+    def flush(self) -> None:
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            sys.stdout.flush()
+            self.buf.clear()
+
+
+def _ensure_sample_file(path: Path, content: bytes) -> bool:
+    """Write a sample file unless it already exists; returns True if written"""
+    # One stat on repeat runs; the directory only needs creating with the file
+    if path.exists():
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return True
+
 
-async def create_test_cv_file():
+def create_test_cv_file(log=print):
     """Create a test CV file if none exists"""
     test_cv_path = Path("./data/uploads/test_cv.txt")
-    test_cv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if not test_cv_path.exists():
-        with open(test_cv_path, "w", encoding="utf-8") as f:
-            f.write(SAMPLE_CV_TEXT)
-
-        print(f"[OK] Created test CV file: {test_cv_path}")
+    if _ensure_sample_file(test_cv_path, _SAMPLE_CV_BYTES):
+        log(f"[OK] Created test CV file: {test_cv_path}")
 
     return str(test_cv_path)
 
 
-async def create_test_job_file():
+def create_test_job_file(log=print):
     """Create a test job ad file if none exists"""
     test_job_path = Path("./data/uploads/test_job.txt")
-    test_job_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if not test_job_path.exists():
-        with open(test_job_path, "w", encoding="utf-8") as f:
-            f.write(SAMPLE_JOB_AD)
 
-        print(f"[OK] Created test job ad file: {test_job_path}")
+    if _ensure_sample_file(test_job_path, _SAMPLE_JOB_BYTES):
+        log(f"[OK] Created test job ad file: {test_job_path}")
 
     return str(test_job_path)
 
 
-def parse_arguments():
-    """Parse command-line arguments"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(
         description="CV-Enhancer Pipeline Test - Demonstrates A2A communication",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -138,7 +155,16 @@ Examples:
         help="Path to job advertisement file (TXT). If not provided, uses sample job ad."
     )
 
-    return parser.parse_args()
+    return parser
+
+
+# Built once, so scripted repeat runs don't rebuild it
+_PARSER = _build_parser()
+
+
+def parse_arguments():
+    """Parse command-line arguments"""
+    return _PARSER.parse_args()
 
 
 async def main():
@@ -147,52 +173,73 @@ async def main():
     # Parse command-line arguments
     args = parse_arguments()
 
+    # Imported here so --help (or importing this module) doesn't load the
+    # LLM, storage and vector DB stacks
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+    from src.config import get_config, get_storage_backend, get_llm_provider, setup_logging
+    from src.agents import OrchestratorAgent
+
     print("=" * 70)
     print("CV-Enhancer Multi-Agent System - Pipeline Test")
     print("Demonstrating A2A Communication for Google/Kaggle Seminar")
     print("=" * 70)
     print()
 
+    log = StepLogger()
+
     # Load configuration
-    print("Step 1: Loading Configuration...")
+    log.log("Step 1: Loading Configuration...")
     try:
         config = get_config(env_file=".env")
-        print(f"   Mode: {config.mode}")
-        print(f"   LLM Provider: {config.llm_provider}")
-        print(f"   LLM Model: {config.llm_model}")
-        print(f"   Storage: {config.storage_type}")
-        print("   [OK] Configuration loaded")
+        log.log(f"   Mode: {config.mode}")
+        log.log(f"   LLM Provider: {config.llm_provider}")
+        log.log(f"   LLM Model: {config.llm_model}")
+        log.log(f"   Storage: {config.storage_type}")
+        log.log("   [OK] Configuration loaded")
     except Exception as e:
-        print(f"   [ERROR] Configuration failed: {e}")
-        print("\nTip: Copy .env.local to .env and configure your LLM settings")
+        log.log(f"   [ERROR] Configuration failed: {e}")
+        log.log("\nTip: Copy .env.local to .env and configure your LLM settings")
+        log.flush()
         return
 
-    print()
+    log.log()
+    log.flush()
 
     # Initialize components
-    print("Step 2: Initializing Components...")
+    log.log("Step 2: Initializing Components...")
     try:
         setup_logging(config)
-        storage = get_storage_backend(config)
-        print(f"   [OK] Storage backend: {storage.__class__.__name__}")
-
-        try:
-            llm = get_llm_provider(config)
-            print(f"   [OK] LLM provider: {llm.__class__.__name__}")
-            print(f"   [OK] Model: {llm.model}")
-        except Exception as e:
-            print(f"   [WARNING] LLM provider failed: {e}")
-            print(f"   Continuing without LLM (will use fallback methods)...")
+
+        # Storage and LLM clients are independent, so build them concurrently
+        storage, llm = await asyncio.gather(
+            asyncio.to_thread(get_storage_backend, config),
+            asyncio.to_thread(get_llm_provider, config),
+            return_exceptions=True
+        )
+
+        if isinstance(storage, BaseException):
+            raise storage
+        log.log(f"   [OK] Storage backend: {storage.__class__.__name__}")
+
+        if isinstance(llm, BaseException):
+            log.log(f"   [WARNING] LLM provider failed: {llm}")
+            log.log(f"   Continuing without LLM (will use fallback methods)...")
             llm = None
+        else:
+            log.log(f"   [OK] LLM provider: {llm.__class__.__name__}")
+            log.log(f"   [OK] Model: {llm.model}")
 
     except Exception as e:
-        print(f"   [ERROR] Component initialization failed: {e}")
+        log.log(f"   [ERROR] Component initialization failed: {e}")
+        log.flush()
         return
 
-    print()
+    log.log()
+    log.flush()
 
     # Initialize Orchestrator
-    print("Step 3: Initializing Orchestrator Agent...")
+    log.log("Step 3: Initializing Orchestrator Agent...")
     try:
         orchestrator = OrchestratorAgent(
             llm_provider=llm,
@@ -204,93 +251,114 @@ async def main():
                 "output_dir": "./data/outputs"
             }
         )
-        print("   [OK] Orchestrator initialized")
-        print(f"   [OK] Registered {len(orchestrator._agent_registry)} agents for A2A communication:")
+        log.log("   [OK] Orchestrator initialized")
+        log.log(f"   [OK] Registered {len(orchestrator._agent_registry)} agents for A2A communication:")
         for agent_name in orchestrator._agent_registry.keys():
-            print(f"      - {agent_name}")
+            log.log(f"      - {agent_name}")
     except Exception as e:
-        print(f"   [ERROR] Orchestrator initialization failed: {e}")
+        log.log(f"   [ERROR] Orchestrator initialization failed: {e}")
+        log.flush()
         return
 
-    print()
+    log.log()
+    log.flush()
 
     # Prepare CV and Job files
-    print("Step 4: Preparing Test Data...")
+    log.log("Step 4: Preparing Test Data...")
     try:
         # Handle CV file
         if args.cv:
             cv_file = args.cv
             if not Path(cv_file).exists():
-                print(f"   [ERROR] CV file not found: {cv_file}")
+                log.log(f"   [ERROR] CV file not found: {cv_file}")
+                log.flush()
                 return
-            print(f"   [OK] Using provided CV file: {cv_file}")
+            log.log(f"   [OK] Using provided CV file: {cv_file}")
         else:
-            cv_file = await create_test_cv_file()
-            print(f"   [OK] Using sample CV file: {cv_file}")
+            cv_file = create_test_cv_file(log.log)
+            log.log(f"   [OK] Using sample CV file: {cv_file}")
 
         # Handle Job Ad file
         if args.job:
             job_file = args.job
             if not Path(job_file).exists():
-                print(f"   [ERROR] Job ad file not found: {job_file}")
+                log.log(f"   [ERROR] Job ad file not found: {job_file}")
+                log.flush()
                 return
             # Read job ad from file
-            with open(job_file, "r", encoding="utf-8") as f:
-                job_ad_text = f.read()
-            print(f"   [OK] Using provided job ad file: {job_file}")
+            job_ad_text = Path(job_file).read_text(encoding="utf-8")
+            log.log(f"   [OK] Using provided job ad file: {job_file}")
         else:
             job_ad_text = SAMPLE_JOB_AD
-            job_file = await create_test_job_file()
-            print(f"   [OK] Using sample job ad: {job_file}")
+            job_file = create_test_job_file(log.log)
+            log.log(f"   [OK] Using sample job ad: {job_file}")
 
     except Exception as e:
-        print(f"   [ERROR] Test data preparation failed: {e}")
+        log.log(f"   [ERROR] Test data preparation failed: {e}")
+        log.flush()
         return
 
-    print()
+    log.log()
+    log.flush()
 
     # Run pipeline
-    print("Step 5: Running CV Enhancement Pipeline...")
-    print("   This will demonstrate A2A communication across all agents:")
-    print("   Orchestrator -> CV Ingestion -> Job Understanding -> User Interaction")
-    print("                -> Knowledge Storage -> CV Generator")
-    print()
+    log.log("Step 5: Running CV Enhancement Pipeline...")
+    log.log("   This will demonstrate A2A communication across all agents:")
+    log.log("   Orchestrator -> CV Ingestion -> Job Understanding -> User Interaction")
+    log.log("                -> Knowledge Storage -> CV Generator")
+    log.log()
+    log.flush()
 
     try:
-        result = await orchestrator.process_cv_request(
+        # Report each step as it finishes rather than after the whole run
+        async for event in orchestrator.stream_cv_request(
             cv_file=cv_file,
             job_ad=job_ad_text,
             user_id="test_user_001",
             job_source_type="text"
-        )
+        ):
+            if event["step"] == "pipeline":
+                result = event["result"]
+            else:
+                print(f"   -> {event['step']}: {event['status']}")
 
         if result["status"] == "completed":
-            print()
-            print("=" * 70)
-            print("PIPELINE COMPLETED SUCCESSFULLY!")
-            print("=" * 70)
-            print(f"\nResults:")
-            print(f"   Session ID: {result['session_id']}")
-            print(f"   User ID: {result['user_id']}")
-            print(f"   Match Score: {result['match_score']:.1f}%")
-            print(f"   Steps Completed: {' -> '.join(result['steps_completed'])}")
-            print(f"\nGenerated Files:")
-            for format_name, file_path in result['output_files'].items():
-                print(f"   - {format_name.upper()}: {file_path}")
-
-            print(f"\nGap Analysis:")
-            print(f"   - Gaps Found: {len(result['gap_analysis']['gaps'])}")
-            print(f"   - Matches: {len(result['gap_analysis']['matches'])}")
-            print(f"   - Recommendations: {len(result['gap_analysis'].get('recommendations', []))}")
-
-            if result['gap_analysis']['gaps']:
-                print(f"\n   Top Gaps:")
-                for i, gap in enumerate(result['gap_analysis']['gaps'][:3], 1):
-                    print(f"   {i}. [{gap['priority'].upper()}] {gap['description']}")
-
-            print("\n[OK] A2A Communication Verified:")
-            print("   All agents successfully communicated via call_agent() method")
-            print("   This demonstrates proper Agent-to-Agent messaging")
+            ga = result["gap_analysis"]
+            gaps = ga["gaps"]
+
+            files = "".join(
+                f"\n   - {format_name.upper()}: {file_path}"
+                for format_name, file_path in result["output_files"].items()
+            )
+            top_gaps = "".join(
+                f"\n   {i}. [{gap['priority'].upper()}] {gap['description']}"
+                for i, gap in enumerate(gaps[:3], 1)
+            )
+            if top_gaps:
+                top_gaps = "\n\n   Top Gaps:" + top_gaps
+
+            rule = "=" * 70
+            print(f"""
+{rule}
+PIPELINE COMPLETED SUCCESSFULLY!
+{rule}
+
+Results:
+   Session ID: {result['session_id']}
+   User ID: {result['user_id']}
+   Match Score: {result['match_score']:.1f}%
+   Steps Completed: {' -> '.join(result['steps_completed'])}
+
+Generated Files:{files}
+
+Gap Analysis:
+   - Gaps Found: {len(gaps)}
+   - Matches: {len(ga['matches'])}
+   - Recommendations: {len(ga.get('recommendations', []))}{top_gaps}
+
+[OK] A2A Communication Verified:
+   All agents successfully communicated via call_agent() method
+   This demonstrates proper Agent-to-Agent messaging""")
 
         else:
             print()
@@ -314,4 +382,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Faster libuv-based event loop if installed (winloop is the Windows port)
+    try:
+        if sys.platform == "win32":
+            import winloop as event_loop
+        else:
+            import uvloop as event_loop
+    except ImportError:
+        event_loop = asyncio
+
+    event_loop.run(main())